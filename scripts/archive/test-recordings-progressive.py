@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 import os
+import re
 import time
+import struct
 import subprocess
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 RECORDINGS_DIR = "/Users/arach/Library/Application Support/com.scout.app/recordings"
 WHISPER_DIR = "/Users/arach/Library/Application Support/com.scout.app/whisper_sessions"
@@ -23,28 +28,58 @@ test_recordings = {
 # Chunk sizes to test
 chunk_sizes = [5, 10, 15, 20]
 
+# Log markers counted in a single pass over each whisper session log
+LOG_MARKERS = re.compile(r"Tiny model chunk|Refined chunk transcription|Auto-selected progressive strategy")
+
+@lru_cache(maxsize=None)
 def get_wav_duration(filepath):
-    """Get duration of WAV file in seconds"""
+    """Get duration of WAV file in seconds.
+
+    Reads the RIFF chunk headers directly instead of going through the `wave`
+    module; results are cached so each recording is only probed once per run.
+    """
     try:
-        import wave
-        with wave.open(filepath, 'rb') as wav_file:
-            frames = wav_file.getnframes()
-            rate = wav_file.getframerate()
-            duration = frames / float(rate)
-            return duration
+        with open(filepath, 'rb') as f:
+            riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+            if riff != b'RIFF' or wave_id != b'WAVE':
+                return 0
+            byte_rate = 0
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return 0
+                chunk_id, chunk_size = struct.unpack('<4sI', header)
+                if chunk_id == b'fmt ':
+                    fmt = f.read(chunk_size + (chunk_size & 1))
+                    byte_rate = struct.unpack_from('<I', fmt, 8)[0]
+                elif chunk_id == b'data':
+                    if not byte_rate:
+                        return 0
+                    # Streaming writers may leave the data size unset
+                    if chunk_size in (0, 0xFFFFFFFF):
+                        chunk_size = os.path.getsize(filepath) - f.tell()
+                    return chunk_size / float(byte_rate)
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
     except:
         return 0
 
 def run_transcription_test(recording, chunk_size):
-    """Run a single transcription test"""
+    """Run a single transcription test.
+
+    Returns the result dict and the report text; output is buffered rather than
+    printed so tests can run concurrently without interleaving.
+    """
+    lines = []
+    emit = lines.append
     recording_path = os.path.join(RECORDINGS_DIR, recording)
     duration = get_wav_duration(recording_path)
     
-    print(f"\n{'='*60}")
-    print(f"Recording: {recording}")
-    print(f"Duration: {duration:.1f}s")
-    print(f"Refinement chunk size: {chunk_size}s")
-    print(f"{'='*60}")
+    emit(f"\n{'='*60}")
+    emit(f"Recording: {recording}")
+    emit(f"Duration: {duration:.1f}s")
+    emit(f"Refinement chunk size: {chunk_size}s")
+    emit(f"{'='*60}")
     
     # Create test config
     config = {
@@ -85,24 +120,27 @@ def run_transcription_test(recording, chunk_size):
     
     # Analyze the log if found
     if latest_log:
-        print(f"\nAnalyzing log: {os.path.basename(latest_log)}")
+        emit(f"\nAnalyzing log: {os.path.basename(latest_log)}")
+        # Extract key metrics, streaming the log line by line
+        counts = Counter()
         with open(latest_log, 'r') as f:
-            log_content = f.read()
-            
-        # Extract key metrics
-        tiny_chunks = log_content.count("Tiny model chunk")
-        medium_chunks = log_content.count("Refined chunk transcription")
-        progressive_selected = "Auto-selected progressive strategy" in log_content
+            for line in f:
+                for match in LOG_MARKERS.finditer(line):
+                    counts[match.group()] += 1
         
-        print(f"Progressive strategy selected: {progressive_selected}")
-        print(f"Tiny model chunks: {tiny_chunks}")
-        print(f"Medium model refinements: {medium_chunks}")
+        tiny_chunks = counts["Tiny model chunk"]
+        medium_chunks = counts["Refined chunk transcription"]
+        progressive_selected = counts["Auto-selected progressive strategy"] > 0
+        
+        emit(f"Progressive strategy selected: {progressive_selected}")
+        emit(f"Tiny model chunks: {tiny_chunks}")
+        emit(f"Medium model refinements: {medium_chunks}")
     
     # Theoretical analysis
-    print(f"\nTheoretical analysis:")
-    print(f"  - Tiny chunks (5s each): {int(duration / 5)}")
-    print(f"  - Medium refinements ({chunk_size}s each): {int(duration / chunk_size)}")
-    print(f"  - Expected latency reduction: refinement stops at recording end")
+    emit(f"\nTheoretical analysis:")
+    emit(f"  - Tiny chunks (5s each): {int(duration / 5)}")
+    emit(f"  - Medium refinements ({chunk_size}s each): {int(duration / chunk_size)}")
+    emit(f"  - Expected latency reduction: refinement stops at recording end")
     
     return {
         "recording": recording,
@@ -110,7 +148,21 @@ def run_transcription_test(recording, chunk_size):
         "chunk_size": chunk_size,
         "tiny_chunks_expected": int(duration / 5),
         "medium_chunks_expected": int(duration / chunk_size),
-    }
+    }, "\n".join(lines)
+
+def run_grid(executor, recordings, sizes):
+    """Run every recording x chunk size combination on the executor, in order"""
+    futures = [
+        executor.submit(run_transcription_test, recording, chunk_size)
+        for recording in recordings
+        for chunk_size in sizes
+    ]
+    results = []
+    for future in futures:
+        result, report = future.result()
+        print(report)
+        results.append(result)
+    return results
 
 def main():
     print("Progressive Transcription Analysis")
@@ -120,21 +172,18 @@ def main():
     
     results = []
     
-    # Test long recordings
-    print("\n\nLONG RECORDINGS (>30s)")
-    print("-" * 80)
-    for recording in test_recordings['long']:
-        for chunk_size in chunk_sizes:
-            result = run_transcription_test(recording, chunk_size)
-            results.append(result)
-    
-    # Test short recordings
-    print("\n\nSHORT RECORDINGS (<30s)")
-    print("-" * 80)
-    for recording in test_recordings['short']:
-        for chunk_size in [5, 10, 15]:  # Skip 20s for short recordings
-            result = run_transcription_test(recording, chunk_size)
-            results.append(result)
+    # Each combination is independent, so run the whole grid concurrently and
+    # print the buffered reports back in submission order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Test long recordings
+        print("\n\nLONG RECORDINGS (>30s)")
+        print("-" * 80)
+        results.extend(run_grid(executor, test_recordings['long'], chunk_sizes))
+        
+        # Test short recordings
+        print("\n\nSHORT RECORDINGS (<30s)")
+        print("-" * 80)
+        results.extend(run_grid(executor, test_recordings['short'], [5, 10, 15]))  # Skip 20s for short recordings
     
     # Summary
     print("\n\nSUMMARY")
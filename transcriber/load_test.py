@@ -39,7 +39,7 @@ def send_request(duration=1.0):
     chunk_id = uuid.uuid4()
     audio_chunk = {
         "id": chunk_id.bytes,
-        "audio": audio.tolist(),
+        "audio_frames": 1,  # Samples follow the header as one raw float32 frame
         "sample_rate": sample_rate,
         "timestamp": time.time(),
     }
@@ -53,7 +53,11 @@ def send_request(duration=1.0):
     # Send and time the request
     start_time = time.time()
     message = msgpack.packb(queue_item, use_bin_type=True)
-    push_socket.send(message)
+    # Zero-copy: libzmq references the packed header and the sample buffer directly
+    push_socket.send_multipart([
+        zmq.Frame(message),
+        zmq.Frame(memoryview(audio.astype('<f4', copy=False)), track=False),
+    ], copy=False)
     
     try:
         result_msg = pull_socket.recv()
@@ -3,11 +3,15 @@
 Parakeet MLX worker that bypasses dependency issues with Python 3.13.
 This directly uses the system Python with installed packages.
 """
-import sys
 import os
+import site
 
-# Add site-packages to path to bypass uv dependency issues
-sys.path.insert(0, '/Users/arach/lib/python3.13/site-packages')
+# Add site-packages to path to bypass uv dependency issues. Appended (not
+# prepended) so stdlib and the interpreter's own packages resolve first; set
+# SCOUT_SITE_PACKAGES to point at a different install, or to "" to skip.
+SITE_PACKAGES = os.environ.get('SCOUT_SITE_PACKAGES', '/Users/arach/lib/python3.13/site-packages')
+if SITE_PACKAGES and os.path.isdir(SITE_PACKAGES):
+    site.addsitedir(SITE_PACKAGES)
 
 # Now import and run the actual worker
 from zmq_server_worker import main
@@ -3,9 +3,12 @@
 
 import sys
 import os
+import site
 
-# Add site-packages to path for uv-installed packages
-sys.path.insert(0, '/Users/arach/lib/python3.13/site-packages')
+# Add site-packages to path for uv-installed packages (appended, see parakeet_worker.py)
+SITE_PACKAGES = os.environ.get('SCOUT_SITE_PACKAGES', '/Users/arach/lib/python3.13/site-packages')
+if SITE_PACKAGES and os.path.isdir(SITE_PACKAGES):
+    site.addsitedir(SITE_PACKAGES)
 
 import ffmpeg
 import numpy as np
@@ -10,6 +10,7 @@
 Test script for the transcription worker.
 """
 
+import os
 import sys
 import struct
 import msgpack
@@ -17,12 +18,23 @@ import numpy as np
 import time
 
 
+# Precompiled little-endian u32 length prefix
+_LEN_PACK = struct.Struct('<I').pack
+
+
 def send_message(message):
     """Send a message to stdout."""
     data = msgpack.packb(message, use_bin_type=True)
-    sys.stdout.buffer.write(struct.pack('<I', len(data)))
-    sys.stdout.buffer.write(data)
-    sys.stdout.buffer.flush()
+    frame = [_LEN_PACK(len(data)), data]
+    
+    # Length prefix and payload go out in a single gathered write
+    sys.stdout.flush()
+    written = os.writev(sys.stdout.fileno(), frame)
+    if written < 4 + len(data):
+        # Short write (e.g. interrupted by a signal): finish the frame
+        remaining = memoryview(b''.join(frame))[written:]
+        while remaining:
+            remaining = remaining[os.write(sys.stdout.fileno(), remaining):]
 
 
 def main():
@@ -38,7 +50,10 @@ def main():
         'type': 'AudioChunk',
         'data': {
             'id': 'test-123',
-            'audio': np.random.randn(16000).tolist(),  # 1 second of audio at 16kHz
+            # 1 second of audio at 16kHz, sent as raw float32 bytes
+            'audio': np.random.default_rng().standard_normal(16000, dtype=np.float32).tobytes(),
+            'dtype': 'float32',
+            'shape': (16000,),
             'sample_rate': 16000,
             'channels': 1,
             'timestamp': int(time.time() * 1000)
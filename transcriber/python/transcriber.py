@@ -2,7 +2,8 @@
 # /// script
 # requires-python = ">=3.10"
 # dependencies = [
-#   "msgpack",
+#   "msgspec",
+#   "pyzmq",
 #   "numpy",
 #   "torch",
 #   "transformers",
@@ -17,18 +18,26 @@ This script uses inline UV script dependencies for easy deployment.
 To run: uv run python/transcriber.py
 """
 
+import os
 import sys
 import json
 import time
+import shutil
 import struct
+import tempfile
+import threading
 import logging
-import traceback
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Callable
+from dataclasses import dataclass
 from enum import Enum
+from queue import Queue, Empty
 
-import msgpack
+import msgspec
 import numpy as np
+import torch
+import torch.multiprocessing as mp
+import zmq
+from transformers import WhisperProcessor, WhisperForConditionalGeneration, BitsAndBytesConfig
 
 # Configure logging
 logging.basicConfig(
@@ -38,6 +47,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# MessagePack codec for the stdin/stdout framing (bytes are encoded as bin)
+MSG_DECODER = msgspec.msgpack.Decoder()
+MSG_ENCODER = msgspec.msgpack.Encoder()
+
+# 4-byte little-endian length prefix in front of every message
+_LEN = struct.Struct('<I')
+
+
+def now_ms() -> int:
+    """Current wall-clock time in integer milliseconds."""
+    return time.time_ns() // 1_000_000
+
 
 class MessageType(Enum):
     """Message types for IPC protocol."""
@@ -59,10 +80,23 @@ class AudioChunk:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AudioChunk':
-        """Create AudioChunk from dictionary."""
+        """Create AudioChunk from dictionary.
+        
+        Audio may arrive either as a list of floats or as raw sample bytes
+        (msgpack bin) with optional 'dtype' and 'shape' fields.
+        """
+        audio = data['audio']
+        if isinstance(audio, (bytes, bytearray, memoryview)):
+            audio = np.frombuffer(audio, dtype=data.get('dtype', 'float32'))
+            if 'shape' in data:
+                audio = audio.reshape(data['shape'])
+            audio = audio.astype(np.float32, copy=False)
+        else:
+            audio = np.array(audio, dtype=np.float32)
+        
         return cls(
             id=data['id'],
-            audio=np.array(data['audio'], dtype=np.float32),
+            audio=audio,
             sample_rate=data['sample_rate'],
             channels=data['channels'],
             timestamp=data['timestamp']
@@ -80,7 +114,13 @@ class Transcript:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            'id': self.id,
+            'text': self.text,
+            'confidence': self.confidence,
+            'timestamp': self.timestamp,
+            'metadata': self.metadata
+        }
 
 
 @dataclass
@@ -92,36 +132,82 @@ class ErrorResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            'id': self.id,
+            'message': self.message,
+            'timestamp': self.timestamp
+        }
 
 
 class TranscriptionModel:
     """Base class for transcription models."""
     
-    def __init__(self, model_name: str = "openai/whisper-base"):
-        """Initialize the transcription model."""
+    def __init__(self, model_name: str = "openai/whisper-base", quantize: bool = True):
+        """Initialize the transcription model (quantize=False leaves int8 to quantize_int8)."""
         self.model_name = model_name
+        self.quantize = quantize
         self.model = None
         self.processor = None
+        self.staging = None  # Host buffer for raw samples, pinned on CUDA
+        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.load_model()
     
     def load_model(self):
-        """Load the model and processor."""
+        """Load the model and processor.
+        
+        SCOUT_QUANT selects weight precision: "int8" (default) applies dynamic
+        int8 quantization to Linear layers on CPU, "nf4" loads 4-bit weights
+        via bitsandbytes on GPU, and "fp32" disables quantization.
+        
+        SCOUT_COMPILE=1 compiles the encoder with torch.compile (default on
+        when CUDA is available, "0" disables it).
+        """
         logger.info(f"Loading model: {self.model_name}")
         
         try:
-            from transformers import WhisperProcessor, WhisperForConditionalGeneration
+            quant = os.environ.get('SCOUT_QUANT', 'int8').lower()
+            use_cuda = self.device.type == 'cuda'
             
             self.processor = WhisperProcessor.from_pretrained(self.model_name)
-            self.model = WhisperForConditionalGeneration.from_pretrained(self.model_name)
             
-            # Move to GPU if available
-            import torch
-            if torch.cuda.is_available():
-                self.model = self.model.to("cuda")
-                logger.info("Model loaded on GPU")
+            if use_cuda and quant == 'nf4':
+                # 4-bit weights are placed on the GPU by bitsandbytes itself
+                self.model = WhisperForConditionalGeneration.from_pretrained(
+                    self.model_name,
+                    quantization_config=BitsAndBytesConfig(
+                        load_in_4bit=True,
+                        bnb_4bit_quant_type='nf4'
+                    ),
+                    device_map='auto',
+                    attn_implementation='sdpa'
+                )
+                logger.info("Model loaded on GPU (nf4)")
             else:
-                logger.info("Model loaded on CPU")
+                # SDPA dispatches attention to fused (flash / memory-efficient) kernels
+                self.model = WhisperForConditionalGeneration.from_pretrained(
+                    self.model_name,
+                    attn_implementation='sdpa'
+                )
+                
+                # Move to GPU if available
+                if use_cuda:
+                    # fp16 halves weight/activation traffic on the memory-bound decoder
+                    self.model = self.model.to("cuda").half()
+                    logger.info("Model loaded on GPU (fp16)")
+                elif quant == 'int8' and self.quantize:
+                    self.quantize_int8()
+                    logger.info("Model loaded on CPU (dynamic int8)")
+                else:
+                    logger.info("Model loaded on CPU")
+            
+            # Log-mel features are computed on the model's device (see _log_mel)
+            feature_extractor = self.processor.feature_extractor
+            self.dtype = self.model.dtype
+            self.mel_filters = torch.from_numpy(feature_extractor.mel_filters.T).to(self.device, torch.float32)
+            self.window = torch.hann_window(feature_extractor.n_fft, device=self.device)
+            
+            if os.environ.get('SCOUT_COMPILE', '1' if use_cuda else '0') == '1':
+                self._compile_encoder()
                 
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
@@ -130,6 +216,77 @@ class TranscriptionModel:
             self.model = None
             self.processor = None
     
+    def quantize_int8(self):
+        """Swap the model's Linear layers for dynamic int8 ones, in place."""
+        # Linear layers dominate CPU inference; int8 matmuls halve their bandwidth
+        torch.ao.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+    
+    def _compile_encoder(self):
+        """
+        Compile the Whisper encoder with torch.compile and warm it up.
+        
+        The encoder always sees a fixed 30s (n_mels x 3000) input, so it
+        specializes well; the autoregressive decoder is left eager. The dummy
+        pass triggers compilation at startup rather than on the first chunk.
+        Falls back to the eager encoder if compilation fails.
+        """
+        feature_extractor = self.processor.feature_extractor
+        encoder = self.model.model.encoder
+        try:
+            self.model.model.encoder = torch.compile(encoder, mode='reduce-overhead')
+            dummy = torch.zeros(
+                (1, feature_extractor.feature_size, feature_extractor.nb_max_frames),
+                device=self.device,
+                dtype=self.dtype
+            )
+            with torch.inference_mode():
+                self.model.model.encoder(dummy)
+            logger.info("Compiled Whisper encoder")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager encoder: {e}")
+            self.model.model.encoder = encoder
+    
+    def _log_mel(self, audios: list[np.ndarray]):
+        """
+        Compute Whisper log-mel features on the model's device.
+        
+        Mirrors WhisperFeatureExtractor (pad/trim to 30s, STFT, mel projection,
+        log10 with 8 dB dynamic range) but only ships raw samples to the device.
+        """
+        feature_extractor = self.processor.feature_extractor
+        n_samples = feature_extractor.n_samples
+        
+        # Reuse one host staging buffer (pinned on CUDA so the upload is async)
+        if self.staging is None or self.staging.shape[0] < len(audios):
+            self.staging = torch.empty(
+                (len(audios), n_samples),
+                dtype=torch.float32,
+                pin_memory=self.device.type == 'cuda'
+            )
+        staging = self.staging[:len(audios)]
+        
+        # Pad or trim every clip to the 30s window directly in the staging buffer
+        for row, audio in zip(staging.numpy(), audios):
+            clip = audio[:n_samples]
+            row[:len(clip)] = clip
+            row[len(clip):] = 0.0
+        
+        audio_t = staging.to(self.device, non_blocking=True)
+        stft = torch.stft(
+            audio_t,
+            feature_extractor.n_fft,
+            feature_extractor.hop_length,
+            window=self.window,
+            return_complex=True
+        )
+        magnitudes = stft[..., :-1].abs() ** 2
+        
+        log_spec = torch.clamp(self.mel_filters @ magnitudes, min=1e-10).log10()
+        log_spec = torch.maximum(log_spec, log_spec.amax(dim=(1, 2), keepdim=True) - 8.0)
+        return (log_spec + 4.0) / 4.0
+    
     def transcribe(self, audio: np.ndarray, sample_rate: int) -> tuple[str, float]:
         """
         Transcribe audio to text.
@@ -137,34 +294,48 @@ class TranscriptionModel:
         Returns:
             Tuple of (text, confidence)
         """
+        return self.transcribe_batch([audio], sample_rate)[0]
+    
+    def transcribe_batch(self, audios: list[np.ndarray], sample_rate: int) -> list[tuple[str, float]]:
+        """
+        Transcribe several audio clips with a single generate call.
+        
+        Returns:
+            List of (text, confidence) tuples, in input order
+        """
         if self.model is None or self.processor is None:
             # Mock transcription for testing
-            return f"Mock transcription for {len(audio)} samples", 0.95
+            return [(f"Mock transcription for {len(audio)} samples", 0.95) for audio in audios]
         
         try:
-            # Process audio
-            inputs = self.processor(
-                audio, 
-                sampling_rate=sample_rate, 
-                return_tensors="pt"
-            )
-            
-            # Move to same device as model
-            import torch
-            if torch.cuda.is_available():
-                inputs = {k: v.to("cuda") for k, v in inputs.items()}
+            if sample_rate == self.processor.feature_extractor.sampling_rate:
+                # Features are computed on the model's device from raw samples
+                input_features = self._log_mel(audios)
+            else:
+                # Process audio (the processor rejects unsupported sample rates)
+                # Only the features are needed; skip building the unused attention mask
+                input_features = self.processor.feature_extractor(
+                    audios, 
+                    sampling_rate=sample_rate, 
+                    return_tensors="pt",
+                    return_attention_mask=False
+                ).input_features
             
-            # Generate transcription
-            generated_ids = self.model.generate(inputs["input_features"])
-            transcription = self.processor.batch_decode(
+            # Generate transcription (features cast to the model's dtype, fp16 on GPU)
+            input_features = input_features.to(self.device, self.dtype, non_blocking=True)
+            with torch.inference_mode(), torch.autocast(
+                'cuda', dtype=torch.float16, enabled=self.device.type == 'cuda'
+            ):
+                generated_ids = self.model.generate(input_features, use_cache=True)
+            transcriptions = self.processor.batch_decode(
                 generated_ids, 
                 skip_special_tokens=True
-            )[0]
+            )
             
             # Calculate confidence (simplified - could use model scores)
             confidence = 0.95  # Placeholder
             
-            return transcription, confidence
+            return [(text, confidence) for text in transcriptions]
             
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
@@ -174,33 +345,58 @@ class TranscriptionModel:
 class ParakeetModel(TranscriptionModel):
     """Parakeet TDT model for transcription."""
     
-    def __init__(self):
+    def __init__(self, quantize: bool = True):
         """Initialize Parakeet model."""
         # For now, use Whisper as a placeholder
         # In production, this would load the actual Parakeet model
-        super().__init__("openai/whisper-base")
+        super().__init__("openai/whisper-base", quantize=quantize)
         logger.info("Initialized Parakeet model (using Whisper as placeholder)")
 
 
 class TranscriptionWorker:
     """Main worker class for handling transcription requests."""
     
-    def __init__(self, model_type: str = "whisper"):
-        """Initialize the transcription worker."""
+    def __init__(
+        self,
+        model_type: str = "whisper",
+        batch_size: int = 4,
+        batch_window_ms: int = 20,
+        model: Optional[TranscriptionModel] = None
+    ):
+        """Initialize the transcription worker (model is loaded unless one is given)."""
         self.model_type = model_type
-        self.model = self._create_model()
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window_ms / 1000.0
+        self.stdin_fd = sys.stdin.fileno()
+        self.stdout_fd = sys.stdout.fileno()
+        # Reused across messages; grown when a larger message arrives
+        self._len_buf = bytearray(4)
+        self._msg_buf = bytearray(1 << 16)
+        # Dispatch table keyed by the raw message type string
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+            MessageType.AUDIO_CHUNK.value: self._handle_audio,
+            MessageType.HEARTBEAT.value: self._handle_heartbeat,
+            MessageType.CONTROL.value: self._handle_control,
+        }
+        
+        # The worker only runs inference; keep autograd off on this thread and
+        # leave cores for the I/O threads and any sibling worker processes
+        torch.set_grad_enabled(False)
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+        
+        self.model = model if model is not None else self._create_model()
         self.stats = {
             'processed': 0,
             'errors': 0,
             'start_time': time.time()
         }
     
-    def _create_model(self) -> TranscriptionModel:
+    def _create_model(self, quantize: bool = True) -> TranscriptionModel:
         """Create the appropriate model based on type."""
         if self.model_type == "parakeet":
-            return ParakeetModel()
+            return ParakeetModel(quantize=quantize)
         else:
-            return TranscriptionModel()
+            return TranscriptionModel(quantize=quantize)
     
     def process_audio_chunk(self, chunk: AudioChunk) -> Transcript:
         """Process an audio chunk and return transcript."""
@@ -218,11 +414,11 @@ class TranscriptionWorker:
                 id=chunk.id,
                 text=text,
                 confidence=confidence,
-                timestamp=int(time.time() * 1000),
+                timestamp=now_ms(),
                 metadata={
                     'model': self.model_type,
                     'sample_rate': chunk.sample_rate,
-                    'duration_ms': len(chunk.audio) * 1000 // chunk.sample_rate
+                    'duration_ms': chunk.audio.shape[0] * 1000 // chunk.sample_rate
                 }
             )
             
@@ -234,105 +430,544 @@ class TranscriptionWorker:
             self.stats['errors'] += 1
             raise
     
+    def process_audio_chunks(self, chunks: list[AudioChunk]) -> list[Transcript]:
+        """Process several audio chunks together, one generate call per sample rate."""
+        by_rate: Dict[int, list[int]] = {}
+        for idx, chunk in enumerate(chunks):
+            by_rate.setdefault(chunk.sample_rate, []).append(idx)
+        
+        results: list[Optional[tuple[str, float]]] = [None] * len(chunks)
+        for sample_rate, indices in by_rate.items():
+            outputs = self.model.transcribe_batch(
+                [chunks[idx].audio for idx in indices],
+                sample_rate
+            )
+            for idx, output in zip(indices, outputs):
+                results[idx] = output
+        
+        timestamp = now_ms()
+        transcripts = []
+        for chunk, (text, confidence) in zip(chunks, results):
+            transcripts.append(Transcript(
+                id=chunk.id,
+                text=text,
+                confidence=confidence,
+                timestamp=timestamp,
+                metadata={
+                    'model': self.model_type,
+                    'sample_rate': chunk.sample_rate,
+                    'duration_ms': chunk.audio.shape[0] * 1000 // chunk.sample_rate
+                }
+            ))
+        
+        self.stats['processed'] += len(transcripts)
+        return transcripts
+    
+    def handle_audio_batch(self, messages: list[Dict[str, Any]]) -> list[Optional[Dict[str, Any]]]:
+        """Handle a batch of AudioChunk messages, returning one response per message."""
+        if len(messages) == 1:
+            return [self.handle_message(messages[0])]
+        
+        try:
+            chunks = [AudioChunk.from_dict(message['data']) for message in messages]
+            transcripts = self.process_audio_chunks(chunks)
+        except Exception as e:
+            # Retry one at a time so each chunk gets its own result or error
+            logger.warning(f"Batch of {len(messages)} chunks failed ({e}), retrying individually")
+            return [self.handle_message(message) for message in messages]
+        
+        return [
+            {
+                'type': MessageType.TRANSCRIPT.value,
+                'data': transcript.to_dict()
+            }
+            for transcript in transcripts
+        ]
+    
     def handle_message(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Handle incoming message and return response."""
-        msg_type = message.get('type')
+        return self.handlers.get(message.get('type'), self._handle_unknown)(message)
+    
+    def _handle_audio(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            chunk = AudioChunk.from_dict(message['data'])
+            transcript = self.process_audio_chunk(chunk)
+            return {
+                'type': MessageType.TRANSCRIPT.value,
+                'data': transcript.to_dict()
+            }
+        except Exception as e:
+            error = ErrorResult(
+                id=message['data'].get('id', 'unknown'),
+                message=str(e),
+                timestamp=now_ms()
+            )
+            return {
+                'type': MessageType.ERROR.value,
+                'data': error.to_dict()
+            }
+    
+    def _handle_heartbeat(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'type': MessageType.HEARTBEAT.value,
+            'data': {
+                'timestamp': now_ms(),
+                'stats': dict(self.stats)
+            }
+        }
+    
+    def _handle_control(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        command = message['data'].get('command')
+        if command == 'shutdown':
+            logger.info("Received shutdown command")
+            return None
+        elif command == 'stats':
+            return {
+                'type': MessageType.CONTROL.value,
+                'data': {'stats': dict(self.stats)}
+            }
+        return self._handle_unknown(message)
+    
+    def _handle_unknown(self, message: Dict[str, Any]) -> None:
+        logger.warning(f"Unknown message type: {message.get('type')}")
+        return None
+    
+    def _read_into(self, buf: bytearray, n: int) -> int:
+        """Fill the first n bytes of buf from stdin; returns the count read (< n only at EOF)."""
+        view = memoryview(buf)
+        pos = 0
+        while pos < n:
+            count = os.readv(self.stdin_fd, [view[pos:n]])
+            if not count:
+                break
+            pos += count
+        return pos
+    
+    def _read_message(self) -> Optional[Dict[str, Any]]:
+        """Read one length-prefixed message from stdin, or None at EOF."""
+        # Messages are length-prefixed for reliable framing
+        if self._read_into(self._len_buf, 4) < 4:
+            return None
+        
+        # Unpack message length
+        msg_length = _LEN.unpack_from(self._len_buf)[0]
         
-        if msg_type == MessageType.AUDIO_CHUNK.value:
+        # Read message data into the reusable buffer
+        if msg_length > len(self._msg_buf):
+            self._msg_buf = bytearray(msg_length)
+        received = self._read_into(self._msg_buf, msg_length)
+        if received < msg_length:
+            raise ValueError(f"Incomplete message: expected {msg_length}, got {received}")
+        
+        # Deserialize message (decoding copies out, so the buffer can be reused)
+        message = MSG_DECODER.decode(memoryview(self._msg_buf)[:msg_length])
+        logger.debug(f"Received message: {message.get('type')}")
+        return message
+    
+    def _write_response(self, response: Dict[str, Any] | bytes):
+        """Write a length-prefixed response (or an already encoded one) to stdout."""
+        # Serialize response
+        response_data = response if isinstance(response, bytes) else MSG_ENCODER.encode(response)
+        frame = [_LEN.pack(len(response_data)), response_data]
+        
+        # One unbuffered gathered write per response
+        written = os.writev(self.stdout_fd, frame)
+        if written < 4 + len(response_data):
+            remaining = memoryview(b''.join(frame))[written:]
+            while remaining:
+                remaining = remaining[os.write(self.stdout_fd, remaining):]
+    
+    def _flush_batch(self, pending: list[Dict[str, Any]], out_q: Queue):
+        """Transcribe pending AudioChunk messages and queue their responses in order."""
+        batch = pending[:]
+        pending.clear()
+        for response in self.handle_audio_batch(batch):
+            if response is not None:
+                out_q.put(response)
+    
+    def _reader(self, in_q: Queue):
+        """Read and decode stdin messages onto in_q; None marks end of input."""
+        while True:
             try:
-                chunk = AudioChunk.from_dict(message['data'])
-                transcript = self.process_audio_chunk(chunk)
-                return {
-                    'type': MessageType.TRANSCRIPT.value,
-                    'data': transcript.to_dict()
-                }
+                message = self._read_message()
+            except Exception as e:
+                logger.error(f"Failed to read message: {e}")
+                continue
+            in_q.put(message)
+            if message is None:
+                return
+    
+    def _writer(self, out_q: Queue):
+        """Encode and write queued responses to stdout until a None sentinel."""
+        while True:
+            response = out_q.get()
+            if response is None:
+                return
+            try:
+                self._write_response(response)
             except Exception as e:
+                logger.error(f"Failed to write response: {e}")
+    
+    def run(self):
+        """Main worker loop.
+        
+        Reading/decoding stdin and encoding/writing stdout run on their own
+        threads, so they overlap with inference on this one. AudioChunk
+        messages that arrive back to back are collected (up to batch_size, for
+        at most batch_window) and transcribed together. A lone chunk with
+        nothing else queued is processed immediately.
+        """
+        logger.info(f"Starting transcription worker (model: {self.model_type}, batch size: {self.batch_size})")
+        
+        in_q: Queue = Queue(maxsize=max(4, 2 * self.batch_size))
+        out_q: Queue = Queue(maxsize=max(4, 2 * self.batch_size))
+        reader = threading.Thread(target=self._reader, args=(in_q,), name='stdin-reader', daemon=True)
+        writer = threading.Thread(target=self._writer, args=(out_q,), name='stdout-writer')
+        reader.start()
+        writer.start()
+        
+        pending: list[Dict[str, Any]] = []
+        lookahead: list[Optional[Dict[str, Any]]] = []
+        deadline = 0.0
+        
+        # One inference-mode scope for the whole loop: no version counters or
+        # view tracking on any tensor the model touches
+        with torch.inference_mode():
+            while True:
+                try:
+                    if pending:
+                        if len(pending) >= self.batch_size:
+                            self._flush_batch(pending, out_q)
+                            continue
+                        try:
+                            if len(pending) == 1:
+                                lookahead.append(in_q.get_nowait())
+                            else:
+                                lookahead.append(in_q.get(timeout=max(0.0, deadline - time.monotonic())))
+                        except Empty:
+                            self._flush_batch(pending, out_q)
+                            continue
+                    
+                    # Take the next decoded message from the reader thread
+                    message = lookahead.pop() if lookahead else in_q.get()
+                    if message is None:
+                        logger.info("No more input, exiting")
+                        break
+                    
+                    if message.get('type') == MessageType.AUDIO_CHUNK.value:
+                        if not pending:
+                            deadline = time.monotonic() + self.batch_window
+                        pending.append(message)
+                        continue
+                    
+                    # Answer queued audio first so responses keep their input order
+                    if pending:
+                        self._flush_batch(pending, out_q)
+                    
+                    # Handle message
+                    response = self.handle_message(message)
+                    
+                    if response is None:
+                        if message.get('type') == MessageType.CONTROL.value:
+                            if message['data'].get('command') == 'shutdown':
+                                break
+                        continue
+                    
+                    out_q.put(response)
+                    
+                except KeyboardInterrupt:
+                    logger.info("Interrupted by user")
+                    break
+                except Exception:
+                    logger.exception("Worker error")
+                    # Continue running despite errors
+                    continue
+            
+            if pending:
+                try:
+                    self._flush_batch(pending, out_q)
+                except Exception as e:
+                    logger.error(f"Failed to flush pending chunks: {e}")
+        
+        # Let the writer drain everything queued before exiting
+        out_q.put(None)
+        writer.join()
+        
+        logger.info("Worker shutting down")
+        logger.info(f"Stats: {self.stats}")
+
+
+# First frame a WorkerPool child sends once it is ready for audio
+WORKER_READY = b'Ready'
+
+
+class ZmqTranscriptionWorker(TranscriptionWorker):
+    """
+    TranscriptionWorker child of a WorkerPool.
+    
+    Same batching loop, but messages come from the pool's PUSH socket and
+    responses go back over PUSH as [type, encoded response] frames instead
+    of stdin/stdout.
+    """
+    
+    def __init__(
+        self,
+        input_endpoint: str,
+        output_endpoint: str,
+        stop_event,
+        model_type: str = "whisper",
+        batch_size: int = 4,
+        batch_window_ms: int = 20,
+        model: Optional[TranscriptionModel] = None
+    ):
+        super().__init__(model_type, batch_size, batch_window_ms, model=model)
+        self.stop_event = stop_event
+        self.context = zmq.Context()
+        
+        self.pull_socket = self.context.socket(zmq.PULL)
+        self.pull_socket.connect(input_endpoint)
+        
+        self.push_socket = self.context.socket(zmq.PUSH)
+        self.push_socket.connect(output_endpoint)
+    
+    def _read_message(self) -> Optional[Dict[str, Any]]:
+        """Receive the next message; None once the pool asks workers to stop."""
+        while not self.stop_event.is_set():
+            if self.pull_socket.poll(100):
+                return MSG_DECODER.decode(self.pull_socket.recv())
+        return None
+    
+    def _write_response(self, response: Dict[str, Any]):
+        """Send a response back to the pool, tagged with its type."""
+        self.push_socket.send_multipart([
+            response['type'].encode(),
+            MSG_ENCODER.encode(response)
+        ])
+    
+    def close(self):
+        self.pull_socket.close(linger=0)
+        self.push_socket.close()
+        self.context.term()
+
+
+def _run_pool_worker(
+    input_endpoint: str,
+    output_endpoint: str,
+    stop_event,
+    model_type: str,
+    batch_size: int,
+    batch_window_ms: int,
+    num_threads: int,
+    log_level: str,
+    model: Optional[TranscriptionModel]
+):
+    """Entry point of a spawned WorkerPool child."""
+    logging.getLogger().setLevel(getattr(logging, log_level))
+    if model is not None and model.model is not None and os.environ.get('SCOUT_QUANT', 'int8').lower() == 'int8':
+        # The shared weights are fp32; only the int8 Linear layers are private
+        model.quantize_int8()
+    worker = ZmqTranscriptionWorker(
+        input_endpoint,
+        output_endpoint,
+        stop_event,
+        model_type=model_type,
+        batch_size=batch_size,
+        batch_window_ms=batch_window_ms,
+        model=model
+    )
+    # Split the cores between the pool's workers
+    torch.set_num_threads(num_threads)
+    # Tell the pool this worker is connected and its model is loaded
+    worker.push_socket.send_multipart([WORKER_READY, b''])
+    try:
+        worker.run()
+    finally:
+        worker.close()
+
+
+class WorkerPool(TranscriptionWorker):
+    """
+    Run several transcription processes behind one stdin/stdout worker.
+    
+    The parent reads framed messages from stdin as usual and answers
+    Heartbeat/Control itself. AudioChunk messages are pushed over a ZeroMQ
+    PUSH socket that the spawned children PULL from (ZeroMQ deals messages
+    across them), and each child batches its share and pushes responses back,
+    which the parent writes to stdout in arrival order. On CPU the parent
+    loads the fp32 model once and shares its weights with every child (with
+    SCOUT_QUANT=int8 each child then quantizes its Linear layers itself); on
+    CUDA each child loads its own replica.
+    """
+    
+    def __init__(
+        self,
+        workers: int,
+        model_type: str = "whisper",
+        batch_size: int = 4,
+        batch_window_ms: int = 20,
+        log_level: str = 'INFO'
+    ):
+        self.workers = max(1, workers)
+        self.log_level = log_level
+        # Share weights through files rather than one fd per tensor
+        mp.set_sharing_strategy('file_system')
+        super().__init__(model_type, batch_size, batch_window_ms)
+        
+        self.ipc_dir = tempfile.mkdtemp(prefix='scout-transcriber-')
+        self.input_endpoint = f"ipc://{self.ipc_dir}/input"
+        self.output_endpoint = f"ipc://{self.ipc_dir}/output"
+        self.context = zmq.Context()
+        self.push_socket = self.context.socket(zmq.PUSH)
+        self.push_socket.bind(self.input_endpoint)
+        self.pull_socket = self.context.socket(zmq.PULL)
+        self.pull_socket.bind(self.output_endpoint)
+        
+        # Forwarded chunks still waiting for a response
+        self.outstanding = 0
+        self.outstanding_cond = threading.Condition()
+        self.stop_event = mp.get_context('spawn').Event()
+        self.processes: list = []
+    
+    def _create_model(self, quantize: bool = True) -> Optional[TranscriptionModel]:
+        """Load the fp32 CPU model to share with the children."""
+        # CUDA replicas are per-process anyway: those children load their own model
+        if torch.cuda.is_available():
+            return None
+        # Dynamic int8 modules can't be rebuilt from shared storage, so the
+        # children quantize after attaching (see _run_pool_worker)
+        model = super()._create_model(quantize=False)
+        if model.model is not None:
+            model.model.share_memory()
+        return model
+    
+    def _handle_audio(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # PUSH blocks while every child is busy (or gone); only wait on live ones
+        while not self.push_socket.poll(100, zmq.POLLOUT):
+            if not any(p.is_alive() for p in self.processes):
+                self.stats['errors'] += 1
                 error = ErrorResult(
                     id=message['data'].get('id', 'unknown'),
-                    message=str(e),
-                    timestamp=int(time.time() * 1000)
+                    message="No transcription workers running",
+                    timestamp=now_ms()
                 )
                 return {
                     'type': MessageType.ERROR.value,
                     'data': error.to_dict()
                 }
         
-        elif msg_type == MessageType.HEARTBEAT.value:
-            return {
-                'type': MessageType.HEARTBEAT.value,
-                'data': {
-                    'timestamp': int(time.time() * 1000),
-                    'stats': self.stats
-                }
-            }
-        
-        elif msg_type == MessageType.CONTROL.value:
-            command = message['data'].get('command')
-            if command == 'shutdown':
-                logger.info("Received shutdown command")
-                return None
-            elif command == 'stats':
-                return {
-                    'type': MessageType.CONTROL.value,
-                    'data': {'stats': self.stats}
-                }
-        
-        logger.warning(f"Unknown message type: {msg_type}")
+        with self.outstanding_cond:
+            self.outstanding += 1
+        self.push_socket.send(MSG_ENCODER.encode(message))
         return None
     
+    def _wait_ready(self, processes: list):
+        """Block until every live child has connected and loaded its model."""
+        ready = 0
+        while ready < sum(p.is_alive() for p in processes):
+            if self.pull_socket.poll(100):
+                msg_type, _ = self.pull_socket.recv_multipart()
+                if msg_type == WORKER_READY:
+                    ready += 1
+        logger.info(f"{ready} transcription workers ready")
+    
+    def _collect(self, out_q: Queue):
+        """Queue responses from the children for the writer and keep stats."""
+        while not self.stop_event.is_set():
+            if not self.pull_socket.poll(100):
+                continue
+            msg_type, response_data = self.pull_socket.recv_multipart()
+            if msg_type == MessageType.TRANSCRIPT.value.encode():
+                self.stats['processed'] += 1
+            elif msg_type == MessageType.ERROR.value.encode():
+                self.stats['errors'] += 1
+            out_q.put(response_data)
+            with self.outstanding_cond:
+                self.outstanding -= 1
+                self.outstanding_cond.notify_all()
+    
     def run(self):
-        """Main worker loop."""
-        logger.info(f"Starting transcription worker (model: {self.model_type})")
+        """Start the children and relay messages until EOF or shutdown."""
+        logger.info(f"Starting {self.workers} transcription workers (model: {self.model_type}, batch size: {self.batch_size})")
         
-        while True:
-            try:
-                # Read message from stdin
-                # Messages are length-prefixed for reliable framing
-                length_bytes = sys.stdin.buffer.read(4)
-                if not length_bytes or len(length_bytes) < 4:
+        ctx = mp.get_context('spawn')
+        num_threads = max(1, (os.cpu_count() or 1) // self.workers)
+        self.processes = processes = [
+            ctx.Process(
+                target=_run_pool_worker,
+                args=(
+                    self.input_endpoint,
+                    self.output_endpoint,
+                    self.stop_event,
+                    self.model_type,
+                    self.batch_size,
+                    int(self.batch_window * 1000),
+                    num_threads,
+                    self.log_level,
+                    self.model
+                ),
+                name=f'transcriber-{i}',
+                daemon=True
+            )
+            for i in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+        # PUSH hands messages only to connected peers, so don't feed the first
+        # child everything while the others are still loading
+        self._wait_ready(processes)
+        
+        in_q: Queue = Queue(maxsize=max(4, 2 * self.batch_size))
+        out_q: Queue = Queue(maxsize=max(4, 2 * self.batch_size))
+        reader = threading.Thread(target=self._reader, args=(in_q,), name='stdin-reader', daemon=True)
+        writer = threading.Thread(target=self._writer, args=(out_q,), name='stdout-writer')
+        collector = threading.Thread(target=self._collect, args=(out_q,), name='result-collector')
+        reader.start()
+        writer.start()
+        collector.start()
+        
+        try:
+            while True:
+                message = in_q.get()
+                if message is None:
                     logger.info("No more input, exiting")
                     break
                 
-                # Unpack message length
-                msg_length = struct.unpack('<I', length_bytes)[0]
-                
-                # Read message data
-                msg_data = sys.stdin.buffer.read(msg_length)
-                if len(msg_data) < msg_length:
-                    logger.error(f"Incomplete message: expected {msg_length}, got {len(msg_data)}")
+                try:
+                    response = self.handle_message(message)
+                except Exception:
+                    logger.exception("Worker error")
                     continue
                 
-                # Deserialize message
-                message = msgpack.unpackb(msg_data, raw=False)
-                logger.debug(f"Received message: {message.get('type')}")
-                
-                # Handle message
-                response = self.handle_message(message)
-                
                 if response is None:
                     if message.get('type') == MessageType.CONTROL.value:
                         if message['data'].get('command') == 'shutdown':
                             break
                     continue
                 
-                # Serialize response
-                response_data = msgpack.packb(response, use_bin_type=True)
-                
-                # Write length-prefixed response to stdout
-                sys.stdout.buffer.write(struct.pack('<I', len(response_data)))
-                sys.stdout.buffer.write(response_data)
-                sys.stdout.buffer.flush()
-                
-            except KeyboardInterrupt:
-                logger.info("Interrupted by user")
-                break
-            except Exception as e:
-                logger.error(f"Worker error: {e}")
-                logger.error(traceback.format_exc())
-                # Continue running despite errors
-                continue
+                out_q.put(response)
+        except KeyboardInterrupt:
+            logger.info("Interrupted by user")
         
-        logger.info("Worker shutting down")
+        # Wait for every forwarded chunk to be answered (unless the children died)
+        with self.outstanding_cond:
+            while self.outstanding and any(p.is_alive() for p in processes):
+                self.outstanding_cond.wait(timeout=0.5)
+        
+        self.stop_event.set()
+        for process in processes:
+            process.join()
+        collector.join()
+        
+        # Let the writer drain everything queued before exiting
+        out_q.put(None)
+        writer.join()
+        
+        self.push_socket.close(linger=0)
+        self.pull_socket.close(linger=0)
+        self.context.term()
+        shutil.rmtree(self.ipc_dir, ignore_errors=True)
+        
+        logger.info("Worker pool shutting down")
         logger.info(f"Stats: {self.stats}")
 
 
@@ -347,6 +982,28 @@ def main():
         default='whisper',
         help='Model type to use'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=4,
+        help='Maximum number of audio chunks transcribed per generate call'
+    )
+    parser.add_argument(
+        '--batch-window-ms',
+        type=int,
+        default=20,
+        help='How long to keep collecting a batch once chunks start queuing'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of transcription processes (more than 1 runs a worker pool). '
+             'On CPU the fp32 weights are loaded once and shared; with SCOUT_QUANT=int8 '
+             '(the default) each process also keeps its own int8 copy of the Linear '
+             'layers, about a quarter of their fp32 size. On CUDA every process loads '
+             'a full replica'
+    )
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -360,7 +1017,20 @@ def main():
     logging.getLogger().setLevel(getattr(logging, args.log_level))
     
     # Create and run worker
-    worker = TranscriptionWorker(model_type=args.model)
+    if args.workers > 1:
+        worker = WorkerPool(
+            args.workers,
+            model_type=args.model,
+            batch_size=args.batch_size,
+            batch_window_ms=args.batch_window_ms,
+            log_level=args.log_level
+        )
+    else:
+        worker = TranscriptionWorker(
+            model_type=args.model,
+            batch_size=args.batch_size,
+            batch_window_ms=args.batch_window_ms
+        )
     worker.run()
 
 
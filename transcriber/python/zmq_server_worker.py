@@ -24,7 +24,7 @@ import time
 import uuid
 import logging
 import traceback
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from datetime import datetime, timezone
 
 # Ensure FFmpeg is in PATH for Parakeet MLX
@@ -51,6 +51,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def decode_audio(audio: Any) -> np.ndarray:
+    """Decode audio sent as raw little-endian float32 bytes or a list of floats."""
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return np.frombuffer(audio, dtype='<f4')
+    return np.array(audio, dtype=np.float32)
+
+
 class ZmqServerWorker:
     """ZeroMQ server-mode transcription worker."""
     
@@ -328,8 +335,13 @@ class ZmqServerWorker:
         except Exception as e:
             logger.error(f"Failed to send status: {e}")
     
-    def process_message(self, message: bytes) -> Optional[Dict[str, Any]]:
-        """Process a message from the queue."""
+    def process_message(self, message: bytes, audio_frames: Sequence[bytes] = ()) -> Optional[Dict[str, Any]]:
+        """
+        Process a message from the queue.
+        
+        Large clients may stream the samples as trailing frames of a multipart
+        message instead of inline; the header's 'audio_frames' gives their count.
+        """
         try:
             # Deserialize the QueueItem wrapper
             queue_item = msgpack.unpackb(message, raw=False)
@@ -359,6 +371,12 @@ class ZmqServerWorker:
             
             logger.info(f"Worker {self.worker_id} processing audio chunk: {chunk_id}")
             
+            # Reassemble audio that arrived as separate frames after the header
+            if 'audio_frames' in audio_chunk:
+                if len(audio_frames) != audio_chunk['audio_frames']:
+                    raise ValueError(f"Expected {audio_chunk['audio_frames']} audio frames, got {len(audio_frames)}")
+                audio_chunk['audio'] = b''.join(audio_frames)
+            
             # Check audio data type
             audio_data_type = audio_chunk.get('audio_data_type', 'AUDIO_BUFFER')  # Default to buffer for backwards compatibility
             
@@ -389,7 +407,7 @@ class ZmqServerWorker:
             elif audio_data_type == 'AUDIO_BUFFER':
                 # Audio data mode - use provided audio buffer
                 logger.info(f"Using provided audio buffer (AUDIO_BUFFER mode)")
-                audio = np.array(audio_chunk['audio'], dtype=np.float32)
+                audio = decode_audio(audio_chunk['audio'])
                 sample_rate = audio_chunk['sample_rate']
                 logger.info(f"Received {len(audio)} samples at {sample_rate}Hz")
                 
@@ -409,7 +427,7 @@ class ZmqServerWorker:
                     else:
                         sample_rate = file_sample_rate
                 else:
-                    audio = np.array(audio_chunk['audio'], dtype=np.float32)
+                    audio = decode_audio(audio_chunk['audio'])
                     sample_rate = audio_chunk['sample_rate']
             
             # Validate audio is not empty
@@ -498,11 +516,11 @@ class ZmqServerWorker:
         while True:
             try:
                 # Try to receive a message
-                message = self.pull_socket.recv()
-                logger.debug(f"Received message ({len(message)} bytes)")
+                message, *audio_frames = self.pull_socket.recv_multipart()
+                logger.debug(f"Received message ({len(message)} bytes + {len(audio_frames)} audio frames)")
                 
                 # Process the message
-                result = self.process_message(message)
+                result = self.process_message(message, audio_frames)
                 
                 if result:
                     # Serialize and send result
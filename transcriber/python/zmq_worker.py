@@ -20,7 +20,7 @@ import time
 import uuid
 import logging
 import traceback
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from datetime import datetime, timezone
 
 import zmq
@@ -41,6 +41,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def decode_audio(audio: Any) -> np.ndarray:
+    """Decode audio sent as raw little-endian float32 bytes or a list of floats."""
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return np.frombuffer(audio, dtype='<f4')
+    return np.array(audio, dtype=np.float32)
+
+
 class ZmqTranscriptionWorker:
     """ZeroMQ-based transcription worker."""
     
@@ -181,8 +188,13 @@ class ZmqTranscriptionWorker:
         except Exception as e:
             logger.error(f"Failed to send status: {e}")
     
-    def process_message(self, message: bytes) -> Optional[Dict[str, Any]]:
-        """Process a message from the queue."""
+    def process_message(self, message: bytes, audio_frames: Sequence[bytes] = ()) -> Optional[Dict[str, Any]]:
+        """
+        Process a message from the queue.
+        
+        Large clients may stream the samples as trailing frames of a multipart
+        message instead of inline; the header's 'audio_frames' gives their count.
+        """
         try:
             # Deserialize the QueueItem wrapper
             queue_item = msgpack.unpackb(message, raw=False)
@@ -207,8 +219,14 @@ class ZmqTranscriptionWorker:
             
             logger.info(f"Worker {self.worker_id} processing audio chunk: {chunk_id}")
             
+            # Reassemble audio that arrived as separate frames after the header
+            if 'audio_frames' in audio_chunk:
+                if len(audio_frames) != audio_chunk['audio_frames']:
+                    raise ValueError(f"Expected {audio_chunk['audio_frames']} audio frames, got {len(audio_frames)}")
+                audio_chunk['audio'] = b''.join(audio_frames)
+            
             # Extract audio data
-            audio = np.array(audio_chunk['audio'], dtype=np.float32)
+            audio = decode_audio(audio_chunk['audio'])
             sample_rate = audio_chunk['sample_rate']
             
             # Transcribe
@@ -283,11 +301,11 @@ class ZmqTranscriptionWorker:
         while True:
             try:
                 # Try to receive a message
-                message = self.pull_socket.recv()
-                logger.debug(f"Received message ({len(message)} bytes)")
+                message, *audio_frames = self.pull_socket.recv_multipart()
+                logger.debug(f"Received message ({len(message)} bytes + {len(audio_frames)} audio frames)")
                 
                 # Process the message
-                result = self.process_message(message)
+                result = self.process_message(message, audio_frames)
                 
                 if result:
                     # Serialize and send result
@@ -4,6 +4,7 @@
 # dependencies = [
 #   "msgpack",
 #   "numpy",
+#   "watchfiles",
 # ]
 # ///
 """
@@ -12,19 +13,23 @@ Simple test for Scout Transcriber - direct file access to queues.
 
 import os
 import sys
+import mmap
 import time
 import msgpack
 import numpy as np
 from pathlib import Path
 from uuid import uuid4
+from watchfiles import watch, Change
 
 def create_test_audio(duration=2.0, sample_rate=16000):
     """Create test audio (sine wave)."""
     num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples)
-    # Create a simple tone
-    audio = np.sin(2 * np.pi * 440 * t) * 0.3
-    return audio.astype(np.float32)
+    # Create a simple tone, computing the phase in place in float32
+    audio = np.arange(num_samples, dtype=np.float32)
+    audio *= np.float32(2 * np.pi * 440 / sample_rate)
+    np.sin(audio, out=audio)
+    audio *= np.float32(0.3)
+    return audio
 
 def submit_audio_direct(audio_data, sample_rate=16000):
     """Submit audio directly to queue directory."""
@@ -34,7 +39,7 @@ def submit_audio_direct(audio_data, sample_rate=16000):
     # Create audio chunk
     audio_chunk = {
         "id": chunk_id,
-        "audio": audio_data.tolist(),
+        "audio": audio_data.astype('<f4', copy=False).tobytes(),  # Raw float32 samples
         "sample_rate": sample_rate,
         "channels": 1,
         "timestamp": timestamp,
@@ -62,38 +67,54 @@ def submit_audio_direct(audio_data, sample_rate=16000):
     
     return chunk_id, file_path
 
+def read_result_file(file_path):
+    """Decode a result file through a read-only memory map (no bytes copy)."""
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return msgpack.unpackb(mm, raw=False)
+
 def check_output_simple(chunk_id, timeout=30):
     """Check output directory for results."""
     output_dir = Path("/tmp/scout-transcriber/output")
+    output_dir.mkdir(parents=True, exist_ok=True)
     start_time = time.time()
     
     print(f"\n⏳ Waiting for result (timeout: {timeout}s)...")
     
-    while time.time() - start_time < timeout:
-        if output_dir.exists():
-            for file_path in output_dir.glob("*.msgpack"):
-                try:
-                    with open(file_path, 'rb') as f:
-                        data = f.read()
-                        result = msgpack.unpackb(data, raw=False)
-                        
-                        # Check if this is our result
-                        result_id = None
-                        if isinstance(result, dict):
-                            if "id" in result and result["id"] == chunk_id:
-                                print(f"\n✅ Found result!")
-                                print(f"   File: {file_path.name}")
-                                print(f"   Content: {result}")
-                                # Clean up
-                                file_path.unlink()
-                                return result
-                except Exception as e:
-                    # Skip bad files
-                    continue
+    def find_result(paths):
+        for file_path in paths:
+            if file_path.suffix != ".msgpack":
+                continue
+            try:
+                result = read_result_file(file_path)
+            except Exception:
+                # Skip bad or partially written files
+                continue
+            
+            # Check if this is our result
+            if isinstance(result, dict) and result.get("id") == chunk_id:
+                print(f"\n✅ Found result!")
+                print(f"   File: {file_path.name}")
+                print(f"   Content: {result}")
+                # Clean up
+                file_path.unlink()
+                return result
+        return None
+    
+    # Results written before we started watching
+    result = find_result(output_dir.glob("*.msgpack"))
+    if result is not None:
+        return result
+    
+    # Then react to new files as soon as they land instead of polling
+    for changes in watch(output_dir, rust_timeout=500, yield_on_timeout=True):
+        result = find_result(Path(path) for change, path in changes if change != Change.deleted)
+        if result is not None:
+            return result
+        if time.time() - start_time >= timeout:
+            break
         
         sys.stdout.write(".")
         sys.stdout.flush()
-        time.sleep(0.5)
     
     print(f"\n⏱️ Timeout - no result found")
     return None
@@ -579,18 +579,19 @@ impl TranscriptionService {
                     result = control_socket.recv() => {
                         match result {
                             Ok(msg) => {
-                                // Get bytes from ZmqMessage
-                                let bytes = msg.into_vec()[0].clone();
-                                // Deserialize the worker status
-                                match rmp_serde::from_slice::<WorkerStatus>(&bytes) {
-                                    Ok(status) => {
-                                        debug!("Received worker status: {:?}", status.status);
-                                        if let Err(e) = process_worker_status(status, &queue_monitor, &message_tracker).await {
-                                            error!("Failed to process worker status: {}", e);
+                                // Workers may batch several statuses as frames of one multipart message
+                                for bytes in msg.into_vec() {
+                                    // Deserialize the worker status
+                                    match rmp_serde::from_slice::<WorkerStatus>(&bytes) {
+                                        Ok(status) => {
+                                            debug!("Received worker status: {:?}", status.status);
+                                            if let Err(e) = process_worker_status(status, &queue_monitor, &message_tracker).await {
+                                                error!("Failed to process worker status: {}", e);
+                                            }
+                                        }
+                                        Err(e) => {
+                                            error!("Failed to deserialize worker status: {}", e);
                                         }
-                                    }
-                                    Err(e) => {
-                                        error!("Failed to deserialize worker status: {}", e);
                                     }
                                 }
                             }
@@ -9,6 +9,10 @@ pub struct AudioChunk {
     /// Unique identifier for this chunk
     pub id: Uuid,
     /// Raw audio data as f32 samples
+    ///
+    /// Accepted on the wire either as an array of floats or as a bin payload
+    /// of little-endian f32 samples; always serialized as an array.
+    #[serde(deserialize_with = "deserialize_audio")]
     pub audio: Vec<f32>,
     /// Sample rate (e.g., 16000)
     pub sample_rate: u32,
@@ -70,6 +74,49 @@ impl AudioChunk {
     }
 }
 
+/// Deserialize audio samples from either a sequence of floats or raw
+/// little-endian f32 bytes, so clients can skip per-sample float encoding.
+fn deserialize_audio<'de, D>(deserializer: D) -> Result<Vec<f32>, D::Error>
+where
+    D: serde::Deserializer<'de>,
+{
+    struct AudioVisitor;
+
+    impl<'de> serde::de::Visitor<'de> for AudioVisitor {
+        type Value = Vec<f32>;
+
+        fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+            formatter.write_str("a sequence of f32 samples or little-endian f32 bytes")
+        }
+
+        fn visit_bytes<E>(self, bytes: &[u8]) -> Result<Self::Value, E>
+        where
+            E: serde::de::Error,
+        {
+            if bytes.len() % 4 != 0 {
+                return Err(E::invalid_length(bytes.len(), &self));
+            }
+            Ok(bytes
+                .chunks_exact(4)
+                .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+                .collect())
+        }
+
+        fn visit_seq<A>(self, mut seq: A) -> Result<Self::Value, A::Error>
+        where
+            A: serde::de::SeqAccess<'de>,
+        {
+            let mut samples = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+            while let Some(sample) = seq.next_element::<f32>()? {
+                samples.push(sample);
+            }
+            Ok(samples)
+        }
+    }
+
+    deserializer.deserialize_any(AudioVisitor)
+}
+
 /// Transcript result returned from transcription
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Transcript {
@@ -229,6 +276,40 @@ mod tests {
         assert_eq!(chunk.channels, deserialized.channels);
     }
 
+    #[test]
+    fn test_audio_chunk_from_f32_bytes() {
+        #[derive(Serialize)]
+        struct BinAudioChunk {
+            id: Uuid,
+            #[serde(serialize_with = "as_bytes")]
+            audio: Vec<u8>,
+            sample_rate: u32,
+            channels: u16,
+            timestamp: DateTime<Utc>,
+            metadata: Option<HashMap<String, String>>,
+        }
+
+        fn as_bytes<S: serde::Serializer>(v: &Vec<u8>, s: S) -> Result<S::Ok, S::Error> {
+            s.serialize_bytes(v)
+        }
+
+        let audio = vec![0.1f32, -0.2, 0.3, 0.4];
+        let chunk = BinAudioChunk {
+            id: Uuid::new_v4(),
+            audio: audio.iter().flat_map(|s| s.to_le_bytes()).collect(),
+            sample_rate: 16000,
+            channels: 1,
+            timestamp: Utc::now(),
+            metadata: None,
+        };
+
+        let bytes = rmp_serde::to_vec_named(&chunk).unwrap();
+        let deserialized = AudioChunk::from_bytes(&bytes).unwrap();
+
+        assert_eq!(deserialized.audio, audio);
+        assert_eq!(deserialized.id, chunk.id);
+    }
+
     #[test]
     fn test_transcript_serialization() {
         let id = Uuid::new_v4();
@@ -5,6 +5,7 @@
 #   "msgpack",
 #   "numpy",
 #   "requests",
+#   "watchfiles",
 # ]
 # ///
 """
@@ -17,6 +18,7 @@ communicates through a simple HTTP bridge or direct file operations.
 import sys
 import time
 import json
+import mmap
 import msgpack
 import numpy as np
 import requests
@@ -90,7 +92,7 @@ class TranscriberClient:
         
         audio_chunk = {
             "id": chunk_id,
-            "audio": audio.tolist(),
+            "audio": audio.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
             "sample_rate": sample_rate,
             "channels": 1,
             "timestamp": timestamp,
@@ -128,38 +130,62 @@ class TranscriberClient:
         print(f"\n⏳ Waiting for result (timeout: {timeout}s)...")
         start_time = time.time()
         
-        while time.time() - start_time < timeout:
-            if self.mode == "file":
-                # Check for result files
-                for file_path in self.output_dir.glob("*.msgpack"):
-                    try:
-                        with open(file_path, 'rb') as f:
-                            result = msgpack.unpackb(f.read(), raw=False)
-                            
-                        # Check if this is our result
-                        if self._is_our_result(result, chunk_id):
-                            print(f"\n✅ Result received!")
-                            self._print_result(result)
-                            file_path.unlink()  # Clean up
-                            return result
-                    except Exception:
-                        continue
-                        
-            else:  # HTTP mode
+        if self.mode == "file":
+            # Only file mode watches the output directory
+            from watchfiles import watch, Change
+            
+            # Check results already written, then react to new files as they land
+            result = self._find_result(self.output_dir.glob("*.msgpack"), chunk_id)
+            if result is not None:
+                return result
+            
+            for changes in watch(self.output_dir, rust_timeout=500, yield_on_timeout=True):
+                paths = (Path(path) for change, path in changes if change != Change.deleted)
+                result = self._find_result(paths, chunk_id)
+                if result is not None:
+                    return result
+                if time.time() - start_time >= timeout:
+                    break
+                
+                sys.stdout.write(".")
+                sys.stdout.flush()
+        
+        else:  # HTTP mode
+            while time.time() - start_time < timeout:
                 response = requests.get(f"{self.base_url}/result/{chunk_id}")
                 if response.status_code == 200:
                     result = response.json()
                     print(f"\n✅ Result received via HTTP!")
                     self._print_result(result)
                     return result
-            
-            sys.stdout.write(".")
-            sys.stdout.flush()
-            time.sleep(0.5)
+                
+                sys.stdout.write(".")
+                sys.stdout.flush()
+                time.sleep(0.5)
         
         print(f"\n⏱️ Timeout - no result received")
         return None
     
+    def _find_result(self, paths, chunk_id: str) -> Optional[Dict[str, Any]]:
+        """Return (and remove) the first result file in paths matching chunk_id."""
+        for file_path in paths:
+            if file_path.suffix != ".msgpack":
+                continue
+            try:
+                # Decode through a read-only memory map to avoid a bytes copy
+                with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    result = msgpack.unpackb(mm, raw=False)
+            except Exception:
+                continue
+            
+            # Check if this is our result
+            if self._is_our_result(result, chunk_id):
+                print(f"\n✅ Result received!")
+                self._print_result(result)
+                file_path.unlink()  # Clean up
+                return result
+        return None
+    
     def _is_our_result(self, result: Dict, chunk_id: str) -> bool:
         """Check if a result matches our chunk ID."""
         if isinstance(result, dict):
@@ -38,13 +38,14 @@ def main():
     # Create test audio
     sample_rate = 16000
     duration = 3  # seconds
-    audio = np.random.randn(sample_rate * duration).astype(np.float32) * 0.1
+    audio = np.random.default_rng().standard_normal(sample_rate * duration, dtype=np.float32)
+    audio *= 0.1
     
     # Create audio chunk with UUID as bytes
     chunk_id = uuid.uuid4()
     audio_chunk = {
         "id": chunk_id.bytes,  # Send as raw 16-byte array
-        "audio": audio.tolist(),
+        "audio": audio.tobytes(),  # Raw little-endian float32 samples
         "sample_rate": sample_rate,
         "timestamp": time.time(),
     }
@@ -24,11 +24,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 def create_test_audio(duration_seconds=2.0, sample_rate=16000):
     """Create a test audio signal."""
     num_samples = int(duration_seconds * sample_rate)
-    # Create a simple sine wave
-    t = np.linspace(0, duration_seconds, num_samples)
+    # Create a simple sine wave, computing the phase in place in float32
     frequency = 440  # A4 note
-    audio = np.sin(2 * np.pi * frequency * t) * 0.5
-    return audio.astype(np.float32).tolist()
+    audio = np.arange(num_samples, dtype=np.float32)
+    audio *= np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(audio, out=audio)
+    audio *= np.float32(0.5)
+    # Raw little-endian float32 bytes, sent as a single msgpack bin
+    return audio.astype('<f4', copy=False).tobytes()
 
 def submit_audio_to_queue():
     """Submit test audio to the input queue."""
@@ -61,7 +61,7 @@ class TranscriberClient:
         # Create audio chunk message
         audio_chunk = {
             "id": chunk_id,
-            "audio": audio_data.tolist(),
+            "audio": audio_data.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
             "sample_rate": sample_rate,
             "channels": 1,
             "timestamp": int(time.time() * 1000),
@@ -177,7 +177,7 @@ def main():
     chunk_id = uuid.uuid4()
     audio_chunk = {
         "id": chunk_id.bytes,
-        "audio": audio.tolist(),
+        "audio": audio.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
         "sample_rate": SAMPLE_RATE,  # Use the same constant
         "timestamp": time.time(),
     }
@@ -4,6 +4,7 @@
 # dependencies = [
 #   "pyzmq",
 #   "msgpack",
+#   "ormsgpack",
 #   "numpy",
 # ]
 # ///
@@ -13,23 +14,29 @@ import sys
 import time
 import uuid
 import zmq
-import msgpack
 import numpy as np
 import logging
-from threading import Thread
+from multiprocessing import Process
+
+from zmq_test_utils import pack, unpack
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def start_worker(worker_id):
     """Start a test worker that connects to proxy backend."""
-    context = zmq.Context()
+    context = zmq.Context(io_threads=2)
     
     # Connect to proxy backend ports
     pull_socket = context.socket(zmq.PULL)
+    pull_socket.setsockopt(zmq.RCVHWM, 64)
+    pull_socket.setsockopt(zmq.RCVBUF, 1 << 20)
     pull_socket.connect("tcp://127.0.0.1:5559")  # Backend OUT
     
     push_socket = context.socket(zmq.PUSH)
+    push_socket.setsockopt(zmq.SNDHWM, 64)
+    push_socket.setsockopt(zmq.SNDBUF, 1 << 20)
+    push_socket.setsockopt(zmq.LINGER, 0)
     push_socket.connect("tcp://127.0.0.1:5558")  # Backend IN
     
     # Control plane
@@ -45,31 +52,34 @@ def start_worker(worker_id):
         "timestamp": time.time(),
         "metadata": None
     }
-    control_socket.send(msgpack.packb(status, use_bin_type=True), zmq.NOBLOCK)
+    control_socket.send(pack(status), zmq.NOBLOCK)
     
     # Process messages
     while True:
         try:
-            msg = pull_socket.recv()
-            queue_item = msgpack.unpackb(msg, raw=False)
+            # Decode straight from libzmq's message memory (the proxy hands frames over without copying)
+            frame = pull_socket.recv(copy=False)
+            queue_item = unpack(frame.buffer)
             audio_chunk = queue_item.get('data', {})
             
             chunk_id_bytes = audio_chunk.get('id')
             if isinstance(chunk_id_bytes, bytes) and len(chunk_id_bytes) == 16:
-                chunk_id = str(uuid.UUID(bytes=chunk_id_bytes))
+                # Plain 32-digit hex: cheap to format, and Uuid::parse_str accepts it
+                chunk_id = chunk_id_bytes.hex()
             else:
                 chunk_id = "unknown"
             
-            logger.info(f"Worker {worker_id} processing {chunk_id}")
+            audio = np.frombuffer(audio_chunk.get('audio', b''), dtype='<f4')
+            
+            logger.info(f"Worker {worker_id} processing {chunk_id} ({len(audio)} samples)")
             
-            # Send MessageReceived status
-            status = {
+            # MessageReceived status (sent together with MessageCompleted below)
+            received_status = {
                 "worker_id": worker_id,
                 "status": {"type": "MessageReceived", "message_id": chunk_id},
                 "timestamp": time.time(),
                 "metadata": None
             }
-            control_socket.send(msgpack.packb(status, use_bin_type=True), zmq.NOBLOCK)
             
             # Simulate processing
             time.sleep(0.1)
@@ -87,16 +97,19 @@ def start_worker(worker_id):
             }
             
             result = {"Ok": transcript}
-            push_socket.send(msgpack.packb(result, use_bin_type=True))
+            push_socket.send(pack(result))
             
-            # Send MessageCompleted status
-            status = {
+            # Send MessageReceived + MessageCompleted as one multipart message
+            completed_status = {
                 "worker_id": worker_id,
                 "status": {"type": "MessageCompleted", "message_id": chunk_id, "success": True, "duration_ms": 100},
                 "timestamp": time.time(),
                 "metadata": None
             }
-            control_socket.send(msgpack.packb(status, use_bin_type=True), zmq.NOBLOCK)
+            control_socket.send_multipart(
+                [pack(received_status), pack(completed_status)],
+                zmq.NOBLOCK
+            )
             
             logger.info(f"Worker {worker_id} completed {chunk_id}")
             
@@ -114,20 +127,27 @@ def start_worker(worker_id):
 
 def main():
     """Test client that sends through proxy."""
-    # Start a worker in the background
-    worker_thread = Thread(target=start_worker, args=("test-worker-1",), daemon=True)
-    worker_thread.start()
+    # Start a worker in a separate process so it doesn't share the GIL with
+    # the client (its ZMQ context is created inside the child)
+    worker_process = Process(target=start_worker, args=("test-worker-1",), daemon=True)
+    worker_process.start()
     
     # Give worker time to start
     time.sleep(1)
     
-    context = zmq.Context()
+    context = zmq.Context(io_threads=2)
     
     # Connect to proxy frontend
     push_socket = context.socket(zmq.PUSH)
+    push_socket.setsockopt(zmq.SNDHWM, 64)
+    push_socket.setsockopt(zmq.SNDBUF, 1 << 20)
+    push_socket.setsockopt(zmq.LINGER, 0)
     push_socket.connect("tcp://127.0.0.1:5555")
     
     pull_socket = context.socket(zmq.PULL)
+    pull_socket.setsockopt(zmq.RCVHWM, 64)
+    pull_socket.setsockopt(zmq.RCVBUF, 1 << 20)
+    pull_socket.setsockopt(zmq.LINGER, 0)
     pull_socket.connect("tcp://127.0.0.1:5556")
     pull_socket.setsockopt(zmq.RCVTIMEO, 5000)
     
@@ -139,7 +159,7 @@ def main():
     
     audio_chunk = {
         "id": chunk_id.bytes,
-        "audio": audio.tolist(),
+        "audio": audio.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
         "sample_rate": 16000,
         "timestamp": time.time(),
     }
@@ -150,14 +170,15 @@ def main():
         "timestamp": time.time(),
     }
     
-    message = msgpack.packb(queue_item, use_bin_type=True)
-    push_socket.send(message)
+    # Handed to libzmq without a copy (the proxy relays multipart messages intact)
+    message = pack(queue_item)
+    push_socket.send(zmq.Frame(message), copy=False)
     logger.info(f"Client sent audio chunk {chunk_id}")
     
     # Wait for result
     try:
         result_msg = pull_socket.recv()
-        result = msgpack.unpackb(result_msg, raw=False)
+        result = unpack(result_msg)
         
         if "Ok" in result:
             transcript = result["Ok"]
@@ -4,7 +4,9 @@
 # dependencies = [
 #   "pyzmq",
 #   "msgpack",
+#   "ormsgpack",
 #   "numpy",
+#   "scipy",
 # ]
 # ///
 """Test transcription using speakeasy TTS for real speech audio."""
@@ -14,46 +16,68 @@ import sys
 import time
 import uuid
 import zmq
-import msgpack
 import numpy as np
+from math import gcd
+from scipy.signal import resample_poly
 import logging
 import tempfile
 import os
 import wave
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from zmq_test_utils import send_audio_frames, transcriber_session, unpack
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Synthesized phrases are kept across runs, keyed by a hash of the text
+TTS_CACHE_DIR = Path.home() / ".cache" / "scout_tts"
+
 def generate_speech_with_speakeasy(text):
-    """Use speakeasy to generate TTS audio."""
+    """Use speakeasy to generate TTS audio (cached on disk across runs)."""
     try:
-        # Create a temporary file for the audio
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-        
-        # Call speakeasy to generate speech with OpenAI voice
-        logger.info(f"Generating speech with speakeasy (OpenAI): '{text}'")
-        result = subprocess.run(
-            ['speakeasy', text, '--provider', 'openai', '--out', tmp_path],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            logger.error(f"Speakeasy failed: {result.stderr}")
-            # Try without provider specification
-            result = subprocess.run(
-                ['speakeasy', text, '--out', tmp_path],
-                capture_output=True,
-                text=True
-            )
+        cache_path = TTS_CACHE_DIR / f"{hashlib.blake2b(text.encode(), digest_size=16).hexdigest()}.wav"
         
-        if result.returncode != 0:
-            logger.error(f"Speakeasy error: {result.stderr}")
-            return None, None
+        if cache_path.exists():
+            logger.info(f"Using cached speech: '{text}'")
+        else:
+            # Synthesize into a temporary file next to the cache entry
+            TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(suffix='.wav', dir=TTS_CACHE_DIR, delete=False) as tmp_file:
+                tmp_path = tmp_file.name
+            
+            try:
+                # Call speakeasy to generate speech with OpenAI voice
+                logger.info(f"Generating speech with speakeasy (OpenAI): '{text}'")
+                result = subprocess.run(
+                    ['speakeasy', text, '--provider', 'openai', '--out', tmp_path],
+                    capture_output=True,
+                    text=True
+                )
+                
+                if result.returncode != 0:
+                    logger.error(f"Speakeasy failed: {result.stderr}")
+                    # Try without provider specification
+                    result = subprocess.run(
+                        ['speakeasy', text, '--out', tmp_path],
+                        capture_output=True,
+                        text=True
+                    )
+                
+                if result.returncode != 0:
+                    logger.error(f"Speakeasy error: {result.stderr}")
+                    return None, None
+                
+                # Only complete files ever appear under the cache name
+                os.replace(tmp_path, cache_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
         
         # Read the WAV file
-        with wave.open(tmp_path, 'rb') as wav_file:
+        with wave.open(str(cache_path), 'rb') as wav_file:
             sample_rate = wav_file.getframerate()
             num_frames = wav_file.getnframes()
             audio_data = wav_file.readframes(num_frames)
@@ -65,16 +89,11 @@ def generate_speech_with_speakeasy(text):
             
             # Resample to 16kHz if necessary
             if sample_rate != 16000:
-                # Simple decimation/interpolation
-                ratio = 16000 / sample_rate
-                new_length = int(len(audio) * ratio)
-                indices = np.arange(new_length) / ratio
-                audio = np.interp(indices, np.arange(len(audio)), audio)
+                # Polyphase FIR resampling (anti-aliased, unlike linear interpolation)
+                g = gcd(sample_rate, 16000)
+                audio = resample_poly(audio, 16000 // g, sample_rate // g)
                 sample_rate = 16000
         
-        # Clean up
-        os.unlink(tmp_path)
-        
         logger.info(f"Generated {len(audio)} samples at {sample_rate}Hz")
         return audio.astype(np.float32), sample_rate
         
@@ -85,22 +104,8 @@ def generate_speech_with_speakeasy(text):
         logger.error(f"Error generating speech: {e}")
         return None, None
 
-def test_transcription(audio, sample_rate, description):
-    """Send audio for transcription and display results."""
-    if audio is None:
-        logger.error("No audio to transcribe")
-        return False, None
-    
-    context = zmq.Context()
-    
-    # Connect to the ports where Python worker is binding
-    push_socket = context.socket(zmq.PUSH)
-    push_socket.connect("tcp://127.0.0.1:5555")
-    
-    pull_socket = context.socket(zmq.PULL)
-    pull_socket.connect("tcp://127.0.0.1:5556")
-    pull_socket.setsockopt(zmq.RCVTIMEO, 15000)  # 15 second timeout
-    
+def send_audio(audio, sample_rate, description, *, push):
+    """Queue audio for transcription without waiting; returns the chunk id bytes."""
     logger.info(f"\n{'='*60}")
     logger.info(f"Testing: {description}")
     logger.info(f"Audio: {len(audio)} samples ({len(audio)/sample_rate:.1f} seconds)")
@@ -108,7 +113,6 @@ def test_transcription(audio, sample_rate, description):
     chunk_id = uuid.uuid4()
     audio_chunk = {
         "id": chunk_id.bytes,
-        "audio": audio.tolist(),
         "sample_rate": int(sample_rate),
         "timestamp": time.time(),
     }
@@ -120,37 +124,53 @@ def test_transcription(audio, sample_rate, description):
     }
     
     # Send message
-    start_time = time.time()
-    message = msgpack.packb(queue_item, use_bin_type=True)
-    push_socket.send(message)
+    send_audio_frames(push, queue_item, audio)
     logger.info(f"Sent audio chunk {chunk_id}")
+    return chunk_id.bytes
+
+def collect_results(pending, *, pull):
+    """
+    Drain replies for every chunk in pending ({chunk id bytes: (description, send time)}).
+    
+    Replies can arrive in any order and are matched by chunk id. Returns
+    {chunk id bytes: (success, text)}; chunks still pending when a receive
+    times out are reported as failed.
+    """
+    pending = dict(pending)
+    results = {}
     
-    # Wait for result
-    logger.info("Waiting for transcription...")
+    logger.info(f"\nWaiting for {len(pending)} transcriptions...")
     try:
-        result_msg = pull_socket.recv()
-        elapsed = time.time() - start_time
-        result = msgpack.unpackb(result_msg, raw=False)
-        
-        if "Ok" in result:
-            transcript = result["Ok"]
-            logger.info(f"✅ SUCCESS")
-            logger.info(f"   Text: '{transcript['text']}'")
-            logger.info(f"   Confidence: {transcript['confidence']}")
-            logger.info(f"   Processing: {transcript['metadata']['processing_time_ms']}ms")
-            logger.info(f"   Total time: {elapsed*1000:.0f}ms")
-            return True, transcript['text']
-        else:
-            logger.error(f"❌ ERROR: {result['Err']}")
-            return False, None
+        while pending:
+            result_msg = pull.recv()
+            result = unpack(result_msg)
+            
+            # Skip replies that aren't ours (e.g. late ones from an earlier run)
+            reply_id = (result.get("Ok") or result.get("Err") or {}).get("id")
+            if reply_id not in pending:
+                logger.warning("Skipping reply for an unknown chunk")
+                continue
+            description, start_time = pending.pop(reply_id)
+            elapsed = time.time() - start_time
+            
+            if "Ok" in result:
+                transcript = result["Ok"]
+                logger.info(f"✅ SUCCESS: {description}")
+                logger.info(f"   Text: '{transcript['text']}'")
+                logger.info(f"   Confidence: {transcript['confidence']}")
+                logger.info(f"   Processing: {transcript['metadata']['processing_time_ms']}ms")
+                logger.info(f"   Total time: {elapsed*1000:.0f}ms")
+                results[reply_id] = (True, transcript['text'])
+            else:
+                logger.error(f"❌ ERROR: {description}: {result['Err']}")
+                results[reply_id] = (False, None)
             
     except zmq.Again:
-        logger.error("❌ TIMEOUT waiting for result")
-        return False, None
-    finally:
-        push_socket.close()
-        pull_socket.close()
-        context.term()
+        logger.error(f"❌ TIMEOUT waiting for {len(pending)} result(s)")
+    
+    for chunk_id in pending:
+        results[chunk_id] = (False, None)
+    return results
 
 def main():
     """Run tests with real TTS speech."""
@@ -164,36 +184,35 @@ def main():
         "This is Scout transcriber with ZeroMQ integration.",
     ]
     
-    results = []
+    # Synthesize every phrase up front (in parallel) so the requests can be pipelined
+    with ThreadPoolExecutor(max_workers=4) as tts_pool:
+        speech = list(tts_pool.map(generate_speech_with_speakeasy, test_phrases))
     
-    for i, phrase in enumerate(test_phrases, 1):
-        logger.info(f"\nTest {i}/{len(test_phrases)}")
-        logger.info(f"Original text: '{phrase}'")
-        
-        # Generate speech with speakeasy
-        audio, sample_rate = generate_speech_with_speakeasy(phrase)
-        
-        if audio is not None:
-            # Test transcription
-            success, transcribed = test_transcription(
-                audio, sample_rate, 
-                f"Test {i}: '{phrase[:30]}...'" if len(phrase) > 30 else f"Test {i}: '{phrase}'"
-            )
-            
-            results.append({
-                'original': phrase,
-                'transcribed': transcribed,
-                'success': success
-            })
+    with transcriber_session() as (push, pull):
+        # Push every request without waiting, then drain the replies
+        pending = {}
+        chunk_ids = []
+        for i, (phrase, (audio, sample_rate)) in enumerate(zip(test_phrases, speech), 1):
+            if audio is None:
+                logger.warning(f"Skipping test {i} - could not generate audio")
+                chunk_ids.append(None)
+                continue
             
-            time.sleep(1)  # Small delay between tests
-        else:
-            logger.warning(f"Skipping test {i} - could not generate audio")
-            results.append({
-                'original': phrase,
-                'transcribed': None,
-                'success': False
-            })
+            description = f"Test {i}: '{phrase[:30]}...'" if len(phrase) > 30 else f"Test {i}: '{phrase}'"
+            chunk_id = send_audio(audio, sample_rate, description, push=push)
+            pending[chunk_id] = (description, time.time())
+            chunk_ids.append(chunk_id)
+        
+        transcripts = collect_results(pending, pull=pull)
+    
+    results = []
+    for phrase, chunk_id in zip(test_phrases, chunk_ids):
+        success, transcribed = transcripts.get(chunk_id, (False, None))
+        results.append({
+            'original': phrase,
+            'transcribed': transcribed,
+            'success': success
+        })
     
     # Summary
     logger.info(f"\n{'='*60}")
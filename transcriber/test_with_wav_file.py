@@ -5,151 +5,173 @@
 #   "pyzmq",
 #   "msgpack",
 #   "numpy",
+#   "scipy",
+#   "soundfile",
+#   "sounddevice",
 # ]
 # ///
 """Test transcription using a WAV file or recorded audio."""
 
 import sys
 import time
-import uuid
 import zmq
 import msgpack
 import numpy as np
+import soundfile as sf
+from math import gcd
+from scipy.signal import firwin, resample_poly
+from functools import lru_cache
 import logging
-import wave
 import os
+import hashlib
+import tempfile
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from zmq_test_utils import transcriber_session
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Reused for every message (keeps its internal buffer between calls)
+_PACKER = msgpack.Packer(use_bin_type=True)
+
+# Frames decoded per read when loading a file (keeps the working block cache-sized)
+READ_BLOCK_FRAMES = 65536
+
+# Decoded 16kHz audio is kept across runs, keyed by a hash of the file contents
+LOAD_CACHE_DIR = Path(tempfile.gettempdir()) / "scout-test-cache"
+
+def _file_digest(file_path):
+    """SHA-256 of the file's contents (read in 1 MiB pieces), shortened for a cache key."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for piece in iter(lambda: f.read(1 << 20), b''):
+            digest.update(piece)
+    return digest.hexdigest()[:16]
+
+@lru_cache(maxsize=8)
+def _resample_filter(up, down):
+    """
+    Low-pass FIR taps for resample_poly(up, down), designed once per rate pair.
+    
+    Same design resample_poly does on every call (Kaiser window, 10 zero
+    crossings per side), in float32 to match the audio.
+    """
+    max_rate = max(up, down)
+    taps = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0)).astype(np.float32)
+    taps.setflags(write=False)
+    return taps
+
+def _resample_to_16k(audio, sample_rate):
+    """Resample audio to 16kHz with a polyphase FIR (anti-aliased, unlike linear interpolation)."""
+    logger.info(f"Resampling from {sample_rate}Hz to 16000Hz")
+    g = gcd(sample_rate, 16000)
+    up, down = 16000 // g, sample_rate // g
+    return resample_poly(audio, up, down, window=_resample_filter(up, down))
+
+def _read_mono(sound_file):
+    """Decode an open SoundFile into a mono float32 array."""
+    channels = sound_file.channels
+    
+    # Decode block by block straight into the mono output, so the whole
+    # multichannel file is never held in memory at once
+    audio = np.empty(sound_file.frames, dtype=np.float32)
+    block = np.empty((READ_BLOCK_FRAMES, channels), dtype=np.float32)
+    pos = 0
+    while True:
+        # libsndfile decodes, normalizes and converts to float32 in one pass
+        frames = sound_file.read(out=block)
+        if len(frames) == 0:
+            break
+        mono = audio[pos:pos + len(frames)]
+        
+        # Convert to mono if stereo (one strided add: mean(axis=1) is slow over a 2-wide axis)
+        if channels == 2:
+            np.add(frames[:, 0], frames[:, 1], out=mono)
+            mono *= 0.5
+        elif channels > 2:
+            frames.mean(axis=1, out=mono)
+        else:
+            mono[:] = frames[:, 0]
+        pos += len(frames)
+    return audio[:pos]
+
 def load_wav_file(file_path):
-    """Load audio from a WAV or AIFF file."""
+    """Load audio from a WAV, AIFF or any other format libsndfile reads (cached on disk across runs)."""
     try:
-        # Try to load as AIFF first if extension suggests it
-        if file_path.endswith('.aiff') or file_path.endswith('.aif'):
-            import aifc
-            with aifc.open(file_path, 'rb') as aiff_file:
-                sample_rate = aiff_file.getframerate()
-                num_frames = aiff_file.getnframes()
-                channels = aiff_file.getnchannels()
-                sample_width = aiff_file.getsampwidth()
-                audio_data = aiff_file.readframes(num_frames)
-                
-                # Convert to numpy array
-                if sample_width == 2:
-                    audio = np.frombuffer(audio_data, dtype=np.int16)
-                else:
-                    logger.error(f"Unsupported sample width: {sample_width}")
-                    return None, None
-                
-                # Convert to mono if stereo
-                if channels == 2:
-                    audio = audio.reshape(-1, 2).mean(axis=1)
-                
-                # Convert to float32 normalized
-                audio = audio.astype(np.float32) / 32768.0
-                
-                # Resample to 16kHz if necessary
-                if sample_rate != 16000:
-                    logger.info(f"Resampling from {sample_rate}Hz to 16000Hz")
-                    ratio = 16000 / sample_rate
-                    new_length = int(len(audio) * ratio)
-                    indices = np.arange(new_length) / ratio
-                    audio = np.interp(indices, np.arange(len(audio)), audio)
-                    sample_rate = 16000
-                
-                logger.info(f"Loaded {len(audio)} samples at {sample_rate}Hz from {file_path}")
-                return audio.astype(np.float32), sample_rate
-        else:
-            # Load as WAV
-            with wave.open(file_path, 'rb') as wav_file:
-                sample_rate = wav_file.getframerate()
-                num_frames = wav_file.getnframes()
-                channels = wav_file.getnchannels()
-                sample_width = wav_file.getsampwidth()
-                audio_data = wav_file.readframes(num_frames)
-                
-                # Convert to numpy array
-                if sample_width == 2:
-                    audio = np.frombuffer(audio_data, dtype=np.int16)
-                elif sample_width == 1:
-                    audio = np.frombuffer(audio_data, dtype=np.uint8)
-                    audio = audio.astype(np.int16) - 128
-                else:
-                    logger.error(f"Unsupported sample width: {sample_width}")
-                    return None, None
-                
-                # Convert to mono if stereo
-                if channels == 2:
-                    audio = audio.reshape(-1, 2).mean(axis=1)
-                
-                # Convert to float32 normalized
-                audio = audio.astype(np.float32) / 32768.0
-                
-                # Resample to 16kHz if necessary
-                if sample_rate != 16000:
-                    logger.info(f"Resampling from {sample_rate}Hz to 16000Hz")
-                    ratio = 16000 / sample_rate
-                    new_length = int(len(audio) * ratio)
-                    indices = np.arange(new_length) / ratio
-                    audio = np.interp(indices, np.arange(len(audio)), audio)
-                    sample_rate = 16000
-                
+        with sf.SoundFile(file_path) as sound_file:
+            sample_rate = sound_file.samplerate
+            
+            # Already at 16kHz: nothing to resample, so decode directly (not worth hashing and caching)
+            if sample_rate == 16000:
+                audio = _read_mono(sound_file)
                 logger.info(f"Loaded {len(audio)} samples at {sample_rate}Hz from {file_path}")
-                return audio.astype(np.float32), sample_rate
+                return audio, sample_rate
+            
+            cache_path = LOAD_CACHE_DIR / f"{_file_digest(file_path)}.npy"
+            if cache_path.exists():
+                audio = np.load(cache_path, mmap_mode='r')
+                logger.info(f"Loaded {len(audio)} cached samples at 16000Hz for {file_path}")
+                return audio, 16000
+            
+            audio = _read_mono(sound_file)
+        
+        # Resample to 16kHz
+        audio = _resample_to_16k(audio, sample_rate)
+        sample_rate = 16000
+        
+        logger.info(f"Loaded {len(audio)} samples at {sample_rate}Hz from {file_path}")
+        
+        # Write to a temporary file first so only complete entries appear under the cache name
+        try:
+            LOAD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(suffix='.npy', dir=LOAD_CACHE_DIR, delete=False) as tmp_file:
+                np.save(tmp_file, audio)
+            os.replace(tmp_file.name, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache decoded audio: {e}")
+        
+        return audio, sample_rate
             
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
         return None, None
+    except sf.LibsndfileError as e:
+        logger.error(f"Could not read {file_path}: {e}")
+        return None, None
     except Exception as e:
         logger.error(f"Error loading WAV file: {e}")
         return None, None
 
-def record_audio_with_sox(duration=3, output_file="test_audio.wav"):
-    """Record audio using sox (if available)."""
-    import subprocess
+def record_audio(duration=3, sample_rate=16000):
+    """Record mono float32 audio from the default input device (via sounddevice)."""
     try:
+        import sounddevice as sd
         logger.info(f"Recording {duration} seconds of audio...")
-        result = subprocess.run(
-            ['sox', '-d', output_file, 'trim', '0', str(duration)],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            logger.info(f"Recorded audio to {output_file}")
-            return output_file
-        else:
-            logger.error(f"Recording failed: {result.stderr}")
-            return None
-    except FileNotFoundError:
-        logger.warning("sox not found. Install with: brew install sox")
-        return None
+        audio = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='float32')
+        sd.wait()  # Wait until recording is finished
+        logger.info(f"Recorded {len(audio)} samples at {sample_rate}Hz")
+        return audio[:, 0], sample_rate
+    except Exception as e:
+        logger.warning(f"Could not record audio: {e}")
+        logger.info("Install sounddevice to enable recording: pip install sounddevice")
+        return None, None
 
-def test_transcription(audio, sample_rate, description):
+def test_transcription(audio, sample_rate, description, *, push, pull):
     """Send audio for transcription and display results."""
     if audio is None:
         logger.error("No audio to transcribe")
         return False, None
     
-    context = zmq.Context()
-    
-    # Connect to the ports where Python worker is binding
-    push_socket = context.socket(zmq.PUSH)
-    push_socket.connect("tcp://127.0.0.1:5555")
-    
-    pull_socket = context.socket(zmq.PULL)
-    pull_socket.connect("tcp://127.0.0.1:5556")
-    pull_socket.setsockopt(zmq.RCVTIMEO, 15000)  # 15 second timeout
-    
     logger.info(f"\n{'='*60}")
     logger.info(f"Testing: {description}")
     logger.info(f"Audio: {len(audio)} samples ({len(audio)/sample_rate:.1f} seconds)")
     
-    chunk_id = uuid.uuid4()
+    chunk_id = os.urandom(16)  # 16 raw id bytes (all the receivers need), without a uuid.UUID object
     audio_chunk = {
-        "id": chunk_id.bytes,
-        "audio": audio.tolist(),
+        "id": chunk_id,
+        "audio": audio.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
         "sample_rate": int(sample_rate),
         "timestamp": time.time(),
     }
@@ -162,16 +184,24 @@ def test_transcription(audio, sample_rate, description):
     
     # Send message
     start_time = time.time()
-    message = msgpack.packb(queue_item, use_bin_type=True)
-    push_socket.send(message)
-    logger.info(f"Sent audio chunk {chunk_id}")
+    message = _PACKER.pack(queue_item)
+    push.send(zmq.Frame(message), copy=False)  # libzmq references the packed bytes directly
+    logger.info(f"Sent audio chunk {chunk_id.hex()}")
     
     # Wait for result
     logger.info("Waiting for transcription...")
     try:
-        result_msg = pull_socket.recv()
+        while True:
+            result_frame = pull.recv(copy=False)
+            result = msgpack.unpackb(result_frame.buffer, raw=False)
+            
+            # A late reply to an earlier (timed out) test can still arrive on the shared socket
+            reply_id = (result.get("Ok") or result.get("Err") or {}).get("id")
+            if isinstance(reply_id, bytes) and reply_id != chunk_id:
+                logger.warning("Skipping stale reply for an earlier chunk")
+                continue
+            break
         elapsed = time.time() - start_time
-        result = msgpack.unpackb(result_msg, raw=False)
         
         if "Ok" in result:
             transcript = result["Ok"]
@@ -188,10 +218,6 @@ def test_transcription(audio, sample_rate, description):
     except zmq.Again:
         logger.error("❌ TIMEOUT waiting for result")
         return False, None
-    finally:
-        push_socket.close()
-        pull_socket.close()
-        context.term()
 
 def main():
     """Run tests with WAV files or recorded audio."""
@@ -204,50 +230,7 @@ def main():
     
     args = parser.parse_args()
     
-    if args.file:
-        # Test with provided file
-        audio, sample_rate = load_wav_file(args.file)
-        if audio is not None:
-            test_transcription(audio, sample_rate, f"File: {args.file}")
-    
-    elif args.record:
-        # Record and test
-        recorded_file = record_audio_with_sox(args.record)
-        if recorded_file:
-            audio, sample_rate = load_wav_file(recorded_file)
-            if audio is not None:
-                test_transcription(audio, sample_rate, f"Recorded: {args.record}s")
-                os.unlink(recorded_file)  # Clean up
-    
-    elif args.all:
-        # Try multiple test methods
-        logger.info("Testing with various audio sources...")
-        
-        # 1. Try to find sample WAV files
-        sample_files = [
-            "/System/Library/Sounds/Glass.aiff",  # macOS system sound
-            "/System/Library/Sounds/Hero.aiff",
-            "test.wav",
-            "sample.wav",
-        ]
-        
-        for file_path in sample_files:
-            if Path(file_path).exists():
-                logger.info(f"\nTesting with system sound: {file_path}")
-                audio, sample_rate = load_wav_file(file_path)
-                if audio is not None:
-                    test_transcription(audio, sample_rate, f"System sound: {Path(file_path).name}")
-                    break
-        
-        # 2. Try recording
-        recorded = record_audio_with_sox(3)
-        if recorded:
-            audio, sample_rate = load_wav_file(recorded)
-            if audio is not None:
-                test_transcription(audio, sample_rate, "Recorded audio")
-                os.unlink(recorded)
-    
-    else:
+    if not (args.file or args.record or args.all):
         logger.info("Usage:")
         logger.info("  Test with file:     python test_with_wav_file.py --file audio.wav")
         logger.info("  Record and test:    python test_with_wav_file.py --record 3")
@@ -255,6 +238,52 @@ def main():
         logger.info("\nYou can also create a test audio file with:")
         logger.info("  say 'Hello, this is a test' -o test.wav  # macOS")
         logger.info("  sox -n test.wav synth 3 sine 440         # Generate tone")
+        return
+    
+    with transcriber_session() as (push, pull):
+        if args.file:
+            # Test with provided file
+            audio, sample_rate = load_wav_file(args.file)
+            if audio is not None:
+                test_transcription(audio, sample_rate, f"File: {args.file}", push=push, pull=pull)
+        
+        elif args.record:
+            # Record and test (captured straight into memory at 16kHz)
+            audio, sample_rate = record_audio(args.record)
+            if audio is not None:
+                test_transcription(audio, sample_rate, f"Recorded: {args.record}s", push=push, pull=pull)
+        
+        elif args.all:
+            # Try multiple test methods
+            logger.info("Testing with various audio sources...")
+            
+            # 1. Try to find sample WAV files
+            sample_files = [
+                "/System/Library/Sounds/Glass.aiff",  # macOS system sound
+                "/System/Library/Sounds/Hero.aiff",
+                "test.wav",
+                "sample.wav",
+            ]
+            
+            # Decode every candidate that exists in parallel, then test the first
+            # one (in the order above) that loaded
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                loads = {
+                    file_path: pool.submit(load_wav_file, file_path)
+                    for file_path in sample_files
+                    if Path(file_path).exists()
+                }
+                for file_path, load in loads.items():
+                    audio, sample_rate = load.result()
+                    if audio is not None:
+                        logger.info(f"\nTesting with system sound: {file_path}")
+                        test_transcription(audio, sample_rate, f"System sound: {Path(file_path).name}", push=push, pull=pull)
+                        break
+            
+            # 2. Try recording
+            audio, sample_rate = record_audio(3)
+            if audio is not None:
+                test_transcription(audio, sample_rate, "Recorded audio", push=push, pull=pull)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -82,7 +82,7 @@ class TranscriptionTester:
         
         audio_chunk = {
             "id": chunk_id.bytes,
-            "audio": audio.tolist(),
+            "audio": audio.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
             "sample_rate": 16000,
             "timestamp": time.time(),
         }
@@ -157,7 +157,7 @@ class TranscriptionTester:
             
             audio_chunk = {
                 "id": chunk_id.bytes,
-                "audio": audio.tolist(),
+                "audio": audio.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
                 "sample_rate": 16000,
                 "timestamp": time.time(),
             }
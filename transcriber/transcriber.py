@@ -13,7 +13,7 @@ import subprocess
 import argparse
 import json
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import atexit
 
 class TranscriberService:
@@ -99,10 +99,12 @@ class TranscriberService:
         if not pid:
             print("⚠ No PID file found")
             # Try to find and kill anyway
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                if 'transcriber' in str(proc.info.get('cmdline', [])):
-                    proc.terminate()
-                    print(f"✓ Stopped process {proc.pid}")
+            for found_pid in self._find_transcriber_pids():
+                try:
+                    psutil.Process(found_pid).terminate()
+                    print(f"✓ Stopped process {found_pid}")
+                except psutil.NoSuchProcess:
+                    pass
             return True
         
         try:
@@ -166,17 +168,37 @@ class TranscriberService:
                 if errors:
                     print(f"Last error: {errors[-1]}")
     
+    def _find_transcriber_pids(self) -> List[int]:
+        """PIDs of other processes whose command line mentions transcriber"""
+        try:
+            # pgrep walks /proc in C instead of building a psutil.Process per PID
+            result = subprocess.run(['pgrep', '-f', 'transcriber'], capture_output=True, text=True)
+            pids = [int(pid) for pid in result.stdout.split()]
+        except FileNotFoundError:
+            pids = [
+                proc.pid for proc in psutil.process_iter(['cmdline'])
+                if 'transcriber' in str(proc.info.get('cmdline', []))
+            ]
+        # Never this manager process itself (or e.g. the `uv run` that launched it)
+        return [pid for pid in pids if pid not in (os.getpid(), os.getppid())]
+    
     def _cleanup_ports(self):
         """Clean up ZeroMQ ports"""
+        # One walk of the IPv4 TCP table (the ports bind 127.0.0.1), not a full scan per port
+        listeners = {
+            conn.laddr.port: conn.pid
+            for conn in psutil.net_connections(kind='tcp4')
+            if conn.status == 'LISTEN'
+        }
         for port in [5555, 5556, 5557]:
-            for conn in psutil.net_connections():
-                if conn.laddr.port == port and conn.status == 'LISTEN':
-                    try:
-                        process = psutil.Process(conn.pid)
-                        process.terminate()
-                        print(f"  Cleaned up port {port}")
-                    except:
-                        pass
+            pid = listeners.get(port)
+            if pid:
+                try:
+                    process = psutil.Process(pid)
+                    process.terminate()
+                    print(f"  Cleaned up port {port}")
+                except:
+                    pass
 
 def main():
     parser = argparse.ArgumentParser(description='Scout Transcriber Service Manager')
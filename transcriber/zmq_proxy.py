@@ -24,24 +24,24 @@ logger = logging.getLogger(__name__)
 
 
 def forward_messages(frontend, backend, name):
-    """Forward messages from frontend to backend."""
+    """Forward messages from frontend to backend (in libzmq's C proxy loop).
+    
+    zmq.proxy moves each message between the sockets inside libzmq, so no
+    Python bytes object is allocated or copied per message.
+    """
     logger.info(f"Starting {name} forwarder")
     
-    while True:
-        try:
-            # Receive from frontend
-            message = frontend.recv()
-            logger.debug(f"{name}: Forwarding {len(message)} bytes")
-            
-            # Send to backend
-            backend.send(message)
-            
-        except zmq.ZMQError as e:
-            logger.error(f"{name}: ZMQ error: {e}")
-            break
-        except Exception as e:
-            logger.error(f"{name}: Error: {e}")
-            break
+    try:
+        # Runs until the context is terminated; multipart messages pass through intact
+        zmq.proxy(frontend, backend)
+    except zmq.ContextTerminated:
+        pass
+    except zmq.ZMQError as e:
+        logger.error(f"{name}: ZMQ error: {e}")
+    finally:
+        # Sockets are closed by the thread using them, which lets context.term() return
+        frontend.close()
+        backend.close()
     
     logger.info(f"{name} forwarder stopped")
 
@@ -94,10 +94,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Shutting down proxy...")
     finally:
-        frontend_in.close()
-        frontend_out.close()
-        backend_in.close()
-        backend_out.close()
+        # Interrupts both forwarders, which close their sockets on the way out
         context.term()
         logger.info("Proxy stopped")
 
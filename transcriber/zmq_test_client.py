@@ -67,14 +67,22 @@ class ZmqTranscriberClient:
             Audio samples as numpy array
         """
         num_samples = int(duration * sample_rate)
-        t = np.linspace(0, duration, num_samples)
+        
+        # Phase of the fundamental, scaled in place
+        omega_t = np.linspace(0, duration, num_samples)
+        omega_t *= 2 * np.pi * frequency
         
         # Create sine wave
-        audio = np.sin(2 * np.pi * frequency * t) * 0.3
+        audio = np.sin(omega_t)
+        audio *= 0.3
         
-        # Add some harmonics to make it more interesting
-        audio += np.sin(2 * np.pi * frequency * 2 * t) * 0.1
-        audio += np.sin(2 * np.pi * frequency * 3 * t) * 0.05
+        # Add some harmonics to make it more interesting, reusing one scratch buffer
+        buf = np.empty_like(omega_t)
+        for harmonic, gain in ((2, 0.1), (3, 0.05)):
+            np.multiply(omega_t, harmonic, out=buf)
+            np.sin(buf, out=buf)
+            buf *= gain
+            audio += buf
         
         # Add a bit of noise
         audio += np.random.normal(0, 0.01, num_samples)
@@ -116,13 +124,13 @@ class ZmqTranscriberClient:
             end_idx = min(int((i + 1) * word_duration * sample_rate), num_samples)
             word_len = end_idx - start_idx
             
-            # Create attack-decay envelope for each word
+            # Write the attack-sustain-decay envelope straight into place
             if word_len > 0:
-                attack = np.linspace(0, 1, word_len // 4)
-                sustain = np.ones(word_len // 2)
-                decay = np.linspace(1, 0.3, word_len - len(attack) - len(sustain))
-                word_envelope = np.concatenate([attack, sustain, decay])
-                envelope[start_idx:end_idx] = word_envelope[:word_len]
+                attack_end = start_idx + word_len // 4
+                sustain_end = attack_end + word_len // 2
+                envelope[start_idx:attack_end] = np.linspace(0, 1, attack_end - start_idx)
+                envelope[attack_end:sustain_end] = 1.0
+                envelope[sustain_end:end_idx] = np.linspace(1, 0.3, end_idx - sustain_end)
         
         audio *= envelope
         
@@ -149,7 +157,7 @@ class ZmqTranscriberClient:
         # IMPORTANT: UUIDs must be raw bytes for Rust deserialization
         audio_chunk = {
             "id": chunk_id.bytes,  # Raw 16-byte UUID, not string!
-            "audio": audio.tolist(),  # Convert numpy array to list
+            "audio": audio.astype('<f4', copy=False).tobytes(),  # Raw little-endian float32 samples
             "sample_rate": sample_rate,
             "channels": channels,
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -229,11 +237,8 @@ class ZmqTranscriberClient:
             if result:
                 # Check if this is our result
                 if isinstance(result, dict):
-                    result_id = result.get("id")
-                    if not result_id and "Ok" in result:
-                        result_id = result["Ok"].get("id")
-                    elif not result_id and "Err" in result:
-                        result_id = result["Err"].get("id")
+                    _, payload = self._unwrap_result(result)
+                    result_id = result.get("id") or payload.get("id")
                     
                     if result_id == chunk_id:
                         self._print_result(result)
@@ -244,18 +249,34 @@ class ZmqTranscriberClient:
         print(f"⏱️ Timeout - result for {chunk_id[:8]}... not received")
         return None
     
+    @staticmethod
+    def _unwrap_result(result: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+        """
+        Split a result into its variant tag and payload.
+        
+        Rust's Result<Transcript, TranscriptionError> arrives externally
+        tagged as a single-key {"Ok": ...} / {"Err": ...} map; a bare
+        transcript dict is treated as "Ok". Any other shape yields ("", {}).
+        """
+        if len(result) == 1:
+            tag, payload = next(iter(result.items()))
+            if tag in ("Ok", "Err") and isinstance(payload, dict):
+                return tag, payload
+        if "text" in result:
+            return "Ok", result
+        return "", {}
+    
     def _print_result(self, result: Dict[str, Any]):
         """Pretty print a transcription result."""
-        if "Ok" in result or "text" in result:
-            transcript = result.get("Ok", result)
-            print(f"   Text: '{transcript.get('text', 'N/A')}'")
-            print(f"   Confidence: {transcript.get('confidence', 'N/A')}")
-            if 'metadata' in transcript:
-                print(f"   Metadata: {transcript['metadata']}")
-        elif "Err" in result:
-            error = result["Err"]
-            print(f"   ❌ Error: {error.get('message', 'Unknown error')}")
-            print(f"   Code: {error.get('error_code', 'N/A')}")
+        tag, payload = self._unwrap_result(result)
+        if tag == "Ok":
+            print(f"   Text: '{payload.get('text', 'N/A')}'")
+            print(f"   Confidence: {payload.get('confidence', 'N/A')}")
+            if 'metadata' in payload:
+                print(f"   Metadata: {payload['metadata']}")
+        elif tag == "Err":
+            print(f"   ❌ Error: {payload.get('message', 'Unknown error')}")
+            print(f"   Code: {payload.get('error_code', 'N/A')}")
         else:
             print(f"   Result: {result}")
     
@@ -0,0 +1,88 @@
+"""
+Shared helpers for the ZeroMQ test scripts in this directory.
+
+Run the scripts from here (as usual) so this module is importable.
+"""
+
+from contextlib import contextmanager
+
+import zmq
+import msgpack
+import numpy as np
+
+try:
+    import ormsgpack
+except ImportError:  # Fall back to msgpack-python
+    ormsgpack = None
+
+def make_codec():
+    """Return (pack, unpack) callables, preferring ormsgpack's Rust encoder.
+    
+    ormsgpack is stateless; the msgpack fallback reuses one Packer, so each
+    thread should make its own codec. Every frame is a complete message and
+    is decoded on its own, so a malformed one can't corrupt the next.
+    """
+    if ormsgpack is not None:
+        return ormsgpack.packb, ormsgpack.unpackb
+    
+    packer = msgpack.Packer(use_bin_type=True)
+    
+    def unpack(data):
+        return msgpack.unpackb(data, raw=False)
+    
+    return packer.pack, unpack
+
+# Used for every message on the main thread (bytes are packed as msgpack bin)
+pack, unpack = make_codec()
+
+# Audio follows the message header in frames of at most this size
+# (ZeroMQ throughput peaks around 1 MB messages)
+AUDIO_FRAME_BYTES = 1 << 20
+
+def send_audio_frames(push, queue_item, audio):
+    """
+    Send queue_item as a header frame followed by the audio samples.
+    
+    The samples go as raw little-endian float32 in frames of at most
+    AUDIO_FRAME_BYTES, sent zero-copy straight from the array's buffer; the
+    header's 'audio_frames' tells the worker how many to join back together
+    (python/zmq_server_worker.py reassembles them in process_message).
+    """
+    samples = memoryview(np.ascontiguousarray(audio, dtype='<f4')).cast('B')
+    frames = [samples[i:i + AUDIO_FRAME_BYTES] for i in range(0, len(samples), AUDIO_FRAME_BYTES)]
+    queue_item["data"]["audio_frames"] = len(frames)
+    push.send_multipart([pack(queue_item), *frames], copy=False)
+
+@contextmanager
+def transcriber_session(push_endpoint="tcp://127.0.0.1:5555", pull_endpoint="tcp://127.0.0.1:5556"):
+    """
+    Yield the (push, pull) socket pair shared by every test in the run.
+    
+    The sockets connect once (by default to where the Python worker binds)
+    and stay warm across tests; they're closed without lingering on exit.
+    If the worker isn't up yet, requests wait in the send queue; a worker
+    that never appears shows up as a receive timeout.
+    """
+    # Created here rather than at import, so scripts that fork (or only use
+    # the codec) don't carry a live context and its I/O threads around
+    context = zmq.Context(io_threads=2)
+    
+    push_socket = context.socket(zmq.PUSH)
+    push_socket.setsockopt(zmq.LINGER, 0)
+    push_socket.setsockopt(zmq.SNDHWM, 64)
+    push_socket.setsockopt(zmq.SNDBUF, 1 << 20)
+    push_socket.connect(push_endpoint)
+    
+    pull_socket = context.socket(zmq.PULL)
+    pull_socket.setsockopt(zmq.LINGER, 0)
+    pull_socket.setsockopt(zmq.RCVHWM, 64)
+    pull_socket.setsockopt(zmq.RCVBUF, 1 << 20)
+    pull_socket.setsockopt(zmq.RCVTIMEO, 15000)  # 15 second timeout
+    pull_socket.connect(pull_endpoint)
+    
+    try:
+        yield push_socket, pull_socket
+    finally:
+        push_socket.close(0)
+        pull_socket.close(0)
+        context.term()